@@ -0,0 +1,41 @@
+"""narrow session token column
+
+Revision ID: 10e29f97916a
+Revises: bbad14c78164
+Create Date: 2026-10-15 11:00:41.207316
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "10e29f97916a"
+down_revision: str | Sequence[str] | None = "bbad14c78164"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        "sessions",
+        "token",
+        existing_type=sa.String(length=255),
+        type_=sa.String(length=64, collation="C"),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        "sessions",
+        "token",
+        existing_type=sa.String(length=64, collation="C"),
+        type_=sa.String(length=255),
+        existing_nullable=False,
+    )
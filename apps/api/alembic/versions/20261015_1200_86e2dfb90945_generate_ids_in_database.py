@@ -0,0 +1,43 @@
+"""generate ids in database
+
+Revision ID: 86e2dfb90945
+Revises: 10e29f97916a
+Create Date: 2026-10-15 12:00:18.930562
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "86e2dfb90945"
+down_revision: str | Sequence[str] | None = "10e29f97916a"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in ("users", "sessions"):
+        op.alter_column(
+            table,
+            "id",
+            existing_type=sa.Uuid(),
+            server_default=sa.text("uuidv7()"),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ("users", "sessions"):
+        op.alter_column(
+            table,
+            "id",
+            existing_type=sa.Uuid(),
+            server_default=None,
+            existing_nullable=False,
+        )
@@ -3,10 +3,11 @@
 from collections.abc import AsyncGenerator
 from typing import Annotated
 
-from fastapi import Depends, Request
+from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.database import get_db
+from src.core.context import request_id_var
+from src.core.database import UnitOfWork, get_db
 
 
 async def get_db_session(
@@ -26,9 +27,29 @@ async def get_db_session(
     yield db
 
 
-def get_request_id(request: Request) -> str:
+async def get_unit_of_work(
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> AsyncGenerator[UnitOfWork]:
+    """
+    Get a unit of work that commits once when the endpoint returns.
+
+    Usage:
+        ```python
+        @router.post("/signup")
+        async def signup(data: UserCreate, uow: UnitOfWork = Depends(get_unit_of_work)):
+            user = await UserService(uow.session).create_user(data, commit=False)
+            await SessionService(uow.session).create_session(user, commit=False)
+        ```
     """
-    Get request ID from request state.
+    async with UnitOfWork(db) as uow:
+        yield uow
+
+
+def get_request_id() -> str:
+    """
+    Get request ID for the current request.
+
+    Reads the context variable set by RequestObservabilityMiddleware.
 
     Usage:
         ```python
@@ -37,4 +58,4 @@ def get_request_id(request: Request) -> str:
             logger.info(f"Processing request {request_id}")
         ```
     """
-    return getattr(request.state, "request_id", "unknown")
+    return request_id_var.get()
@@ -1,41 +1,105 @@
 """Health check endpoints."""
 
-from typing import Annotated
+import asyncio
+from time import monotonic
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Response
 from loguru import logger
+from pydantic_core import to_json
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from src import __version__
-from src.api.deps import get_db_session
+from src.core.database import async_engine
 from src.core.settings import settings
 
 router = APIRouter(tags=["Health"])
 
+_PING = text("SELECT 1")
+
+_HEALTH_BASE: dict[str, str] = {
+    "app": settings.app_name,
+    "env": settings.env,
+    "version": __version__,
+}
+
+_ROOT_BODY: bytes = to_json(
+    {
+        "message": f"Welcome to {settings.app_name}",
+        "version": __version__,
+        "docs": "/docs",
+        "redoc": "/redoc",
+        "health": "/v1/health",
+        "live": "/v1/live",
+    }
+)
+
+_db_status: str = "unknown"
+_db_checked_at: float | None = None
+_db_lock = asyncio.Lock()
+
+
+async def get_db_status() -> str:
+    """
+    Get database status, probing at most once per cache TTL.
+
+    Concurrent callers share a single in-flight probe, and the probe is
+    bounded by ``settings.health_db_timeout``.
+
+    Returns:
+        "healthy" or "unhealthy"
+    """
+    global _db_status, _db_checked_at
+
+    if _db_checked_at is not None and monotonic() - _db_checked_at < settings.health_cache_ttl:
+        return _db_status
+
+    async with _db_lock:
+        if _db_checked_at is not None and monotonic() - _db_checked_at < settings.health_cache_ttl:
+            return _db_status
+
+        try:
+            # Covers pool checkout and connecting too, not just the query
+            async with asyncio.timeout(settings.health_db_timeout):
+                async with async_engine.connect() as conn:
+                    _ = await conn.execute(_PING)
+            _db_status = "healthy"
+        except Exception as e:
+            logger.error(f"Database health check failed: {e!r}")
+            _db_status = "unhealthy"
+
+        _db_checked_at = monotonic()
+
+    return _db_status
+
+
+@router.get("/live")
+async def liveness_check():
+    """
+    Liveness check endpoint.
+
+    Never touches the database, so a congested pool can't fail liveness.
+
+    Returns:
+        Static OK status
+    """
+    return {"status": "ok"}
+
 
 @router.get("/health")
-async def health_check(db: Annotated[AsyncSession, Depends(get_db_session)]):
+async def health_check():
     """
-    Health check endpoint with database status.
+    Readiness check endpoint with database status.
+
+    The database status is cached for ``settings.health_cache_ttl`` seconds.
 
     Returns:
         Health status including database connection
     """
-    db_status = "unknown"
-    try:
-        result = await db.execute(text("SELECT 1"))
-        _ = result.scalar()
-        db_status = "healthy"
-    except Exception as e:
-        logger.error(f"Database health check failed: {e}")
-        db_status = "unhealthy"
+    db_status = await get_db_status()
 
     return {
         "status": "healthy" if db_status == "healthy" else "degraded",
-        "app": settings.app_name,
-        "env": settings.env,
-        "version": __version__,
+        **_HEALTH_BASE,
         "database": db_status,
     }
 
@@ -48,10 +112,4 @@ async def root():
     Returns:
         Basic API information and available endpoints
     """
-    return {
-        "message": f"Welcome to {settings.app_name}",
-        "version": __version__,
-        "docs": "/docs",
-        "redoc": "/redoc",
-        "health": "/v1/health",
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
@@ -1,9 +1,26 @@
 """Core application components."""
 
+import importlib
+from typing import TYPE_CHECKING
+
 from src.core import exceptions
-from src.core.database import async_engine, async_session_maker, get_db
-from src.core.logging import get_logger, setup_logging
-from src.core.settings import get_settings, settings
+
+if TYPE_CHECKING:
+    from src.core.database import async_engine, async_session_maker, get_db
+    from src.core.logging import get_logger, setup_logging
+    from src.core.settings import get_settings
+
+# Loaded on first access so importing src.core doesn't build the engine.
+# The settings object is not re-exported: its name would shadow the
+# src.core.settings submodule. Use get_settings() or src.core.settings.settings.
+_LAZY_IMPORTS: dict[str, str] = {
+    "async_engine": "src.core.database",
+    "async_session_maker": "src.core.database",
+    "get_db": "src.core.database",
+    "get_logger": "src.core.logging",
+    "setup_logging": "src.core.logging",
+    "get_settings": "src.core.settings",
+}
 
 __all__ = [
     "async_engine",
@@ -12,6 +29,13 @@ __all__ = [
     "get_db",
     "get_logger",
     "get_settings",
-    "settings",
     "setup_logging",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Resolve lazily imported attributes."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
@@ -0,0 +1,91 @@
+"""In-process caching utilities."""
+
+import threading
+from collections import OrderedDict
+from time import monotonic
+
+
+class TTLCache[K, V]:
+    """
+    Bounded in-memory cache with per-entry expiry.
+
+    Entries expire ``ttl`` seconds after being set. When full, the oldest
+    entry is evicted. Safe to share between threads.
+
+    Usage:
+        ```python
+        cache: TTLCache[str, int] = TTLCache(maxsize=1024, ttl=30)
+        cache.set("key", 42)
+        value = cache.get("key")  # 42, or None once expired
+        ```
+    """
+
+    def __init__(self, *, maxsize: int, ttl: float) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries
+            ttl: Entry lifetime in seconds
+        """
+        self.maxsize: int = maxsize
+        self.ttl: float = ttl
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if missing or expired
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """
+        Cache a value.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        with self._lock:
+            self._data[key] = (monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                _ = self._data.popitem(last=False)
+
+    def pop(self, key: K) -> V | None:
+        """
+        Remove a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Removed value or None if missing
+        """
+        with self._lock:
+            entry = self._data.pop(key, None)
+            return entry[1] if entry is not None else None
+
+    def clear(self) -> None:
+        """Remove all cached values."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        """Number of cached entries, including expired ones not yet evicted."""
+        return len(self._data)
@@ -0,0 +1,5 @@
+"""Request-scoped context variables."""
+
+from contextvars import ContextVar
+
+request_id_var: ContextVar[str] = ContextVar("request_id", default="unknown")
@@ -1,11 +1,13 @@
 """Database configuration and session management."""
 
-from src.core.database.engine import async_engine, engine
-from src.core.database.session import async_session_maker, get_db
+from src.core.database.engine import async_engine, get_sync_engine
+from src.core.database.session import UnitOfWork, async_session_maker, get_db, get_db_tx
 
 __all__ = [
+    "UnitOfWork",
     "async_engine",
     "async_session_maker",
-    "engine",
     "get_db",
+    "get_db_tx",
+    "get_sync_engine",
 ]
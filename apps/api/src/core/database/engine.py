@@ -1,23 +1,72 @@
 """Database engine configuration."""
 
-from sqlalchemy import create_engine
+from functools import lru_cache
+
+from sqlalchemy import Engine, create_engine
 from sqlalchemy.ext.asyncio import create_async_engine
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from src.core.settings import settings
 
+# Pool sizing only applies to the queue pool; NullPool rejects these arguments.
+_pool_options: dict[str, object] = (
+    {"poolclass": NullPool}
+    if settings.env == "test"
+    else {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_timeout": settings.db_pool_timeout,
+    }
+)
+
+# tcp_keepalives_idle is a server setting: Postgres probes idle clients and
+# reaps connections whose client has gone. It does not tell this pool about
+# dead connections. After a database restart or failover, the first request
+# to hit a stale connection fails and SQLAlchemy then invalidates the whole
+# pool. DB_POOL_PRE_PING trades a round-trip per checkout for not failing it.
+_server_settings: dict[str, str] = {"application_name": settings.app_name}
+if not settings.db_pgbouncer:
+    # PgBouncer rejects unknown startup parameters
+    _server_settings["tcp_keepalives_idle"] = str(settings.db_tcp_keepalives_idle)
+
+# Prepared statements don't survive PgBouncer transaction pooling, so both the
+# asyncpg and SQLAlchemy statement caches are disabled behind it.
+_connect_args: dict[str, object] = {
+    "timeout": settings.db_connect_timeout,
+    "server_settings": _server_settings,
+    "statement_cache_size": 0 if settings.db_pgbouncer else settings.db_statement_cache_size,
+    "prepared_statement_cache_size": 0 if settings.db_pgbouncer else 100,
+}
+
 # Async engine
 async_engine = create_async_engine(
     settings.async_database_url,
     echo=False,  # Disable verbose SQL logging
     future=True,
-    pool_pre_ping=True,
-    poolclass=NullPool if settings.env == "test" else None,
+    pool_pre_ping=settings.db_pool_pre_ping,
+    query_cache_size=settings.db_query_cache_size,  # Compiled SQL cache (LRU)
+    connect_args=_connect_args,
+    **_pool_options,  # pyright: ignore[reportArgumentType]
 )
 
-engine = create_engine(
-    settings.async_database_url.replace("+asyncpg", "+psycopg"),
-    echo=settings.debug,
-    future=True,
-    pool_pre_ping=True,
-)
+
+@lru_cache
+def get_sync_engine() -> Engine:
+    """
+    Get the sync engine, creating it on first use.
+
+    The sync engine is only needed by occasional tooling (scripts,
+    migrations), so it is not built at import time and does not keep
+    a pool of idle connections.
+
+    Returns:
+        Sync SQLAlchemy engine using the psycopg driver
+    """
+    return create_engine(
+        settings.async_database_url.replace("+asyncpg", "+psycopg"),
+        echo=settings.debug,
+        future=True,
+        poolclass=NullPool,
+    )
@@ -1,6 +1,8 @@
 """Database session management."""
 
 from collections.abc import AsyncGenerator
+from types import TracebackType
+from typing import Self
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
@@ -20,6 +22,10 @@ async def get_db() -> AsyncGenerator[AsyncSession]:
     """
     Dependency for getting async database session.
 
+    The session is not committed automatically. Endpoints that modify data
+    must commit explicitly (services do this for you) or use ``get_db_tx``.
+    Any exception rolls the session back.
+
     Yields:
         AsyncSession: Database session.
 
@@ -34,9 +40,68 @@ async def get_db() -> AsyncGenerator[AsyncSession]:
     async with async_session_maker() as session:
         try:
             yield session
-            await session.commit()
         except Exception:
             await session.rollback()
             raise
-        finally:
-            await session.close()
+
+
+async def get_db_tx() -> AsyncGenerator[AsyncSession]:
+    """
+    Dependency for getting async database session wrapped in a transaction.
+
+    The transaction is committed when the request succeeds and rolled back
+    on exception. Do not call ``session.commit()`` inside it.
+
+    Yields:
+        AsyncSession: Database session with an open transaction.
+
+    Example:
+        ```python
+        @app.post("/users")
+        async def create_user(data: UserCreate, db: AsyncSession = Depends(get_db_tx)):
+            db.add(User(email=data.email))
+        ```
+    """
+    async with async_session_maker() as session, session.begin():
+        yield session
+
+
+class UnitOfWork:
+    """
+    Commit several service calls as one transaction.
+
+    Services called with ``commit=False`` only flush their changes; the unit
+    of work commits once on a clean exit and rolls back on exception.
+
+    Example:
+        ```python
+        async with UnitOfWork(db):
+            user = await UserService(db).create_user(data, commit=False)
+            await SessionService(db).create_session(user, commit=False)
+        ```
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """
+        Initialize unit of work.
+
+        Args:
+            session: Session shared by the services taking part
+        """
+        self.session: AsyncSession = session
+
+    async def __aenter__(self) -> Self:
+        """Start the unit of work."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Commit on success, roll back on exception."""
+        if exc_type is None:
+            await self.session.commit()
+        else:
+            await self.session.rollback()
@@ -1,32 +1,71 @@
 """Application lifecycle events."""
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from loguru import logger
-from sqlalchemy import text
 
 from src import __version__
 from src.core.database import async_engine
 from src.core.logging import setup_logging
+from src.core.security import hash_password_async
 from src.core.settings import settings
 
 
 def print_banner() -> None:
     """Print application banner on startup."""
     separator = "═" * 67
-    logger.info(separator)
-    logger.info(f"  {settings.app_name.upper():^63}")
-    logger.info(separator)
-    logger.info(f"  Version      │  {__version__}")
-    logger.info(f"  Environment  │  {settings.env}")
-    logger.info(f"  Debug Mode   │  {'✓ enabled' if settings.debug else '✗ disabled'}")
-    logger.info(f"  Log Level    │  {settings.log_level}")
-    logger.info(separator)
+    lines = [
+        separator,
+        f"  {settings.app_name.upper():^63}",
+        separator,
+        f"  Version      │  {__version__}",
+        f"  Environment  │  {settings.env}",
+        f"  Debug Mode   │  {'✓ enabled' if settings.debug else '✗ disabled'}",
+        f"  Log Level    │  {settings.log_level}",
+        separator,
+    ]
     if settings.debug:
-        logger.info("  Docs         │  http://localhost:8000/docs")
-        logger.info("  Health       │  http://localhost:8000/v1/health")
-        logger.info(separator)
+        lines += [
+            "  Docs         │  http://localhost:8000/docs",
+            "  Health       │  http://localhost:8000/v1/health",
+            "  Liveness     │  http://localhost:8000/v1/live",
+            separator,
+        ]
+    logger.info("\n" + "\n".join(lines))
+
+
+async def warm_up_pool() -> None:
+    """
+    Pre-open database pool connections.
+
+    Opens ``db_pool_size`` connections concurrently so the first requests
+    don't pay the connection handshake. Closing an AsyncConnection returns
+    it to the pool.
+    """
+    if settings.env == "test":
+        return
+
+    connections = await asyncio.gather(
+        *(async_engine.connect() for _ in range(settings.db_pool_size))
+    )
+    _ = await asyncio.gather(*(conn.close() for conn in connections))
+    logger.info(f"Database pool warmed up with {len(connections)} connections")
+
+
+async def warm_up_hasher() -> None:
+    """
+    Run one password hash ahead of the first login.
+
+    The first Argon2 hash in a process pays for allocating and faulting in
+    its memory block; doing it here keeps that out of a user's request.
+    """
+    if settings.env == "test":
+        return
+
+    _ = await hash_password_async("warm-up")
+    logger.info("Password hasher warmed up")
 
 
 async def startup_event() -> None:
@@ -37,12 +76,14 @@ async def startup_event() -> None:
 
     try:
         async with async_engine.connect() as conn:
-            _ = await conn.execute(text("SELECT 1"))
+            _ = await conn.exec_driver_sql("SELECT 1")
         logger.success("Database connection established successfully")
     except Exception as e:
         logger.error(f"Failed to connect to database: {e}")
         raise
 
+    _ = await asyncio.gather(warm_up_pool(), warm_up_hasher())
+
     logger.success("Application started successfully")
 
 
@@ -56,6 +97,9 @@ async def shutdown_event() -> None:
 
     logger.success("Application shutdown complete")
 
+    # Flush records queued by enqueue=True sinks
+    await logger.complete()
+
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
@@ -1,5 +1,7 @@
 """Authentication and authorization exceptions."""
 
+from typing import ClassVar
+
 from src.core.exceptions.base import AppException
 from src.core.exceptions.codes import ErrorCode
 
@@ -11,16 +13,8 @@ class AuthenticationException(AppException):
     Raised when authentication fails.
     """
 
-    def __init__(
-        self,
-        message: str = "Authentication failed",
-        code: ErrorCode | str | None = None,
-        details: dict[str, object] | None = None,
-    ) -> None:
-        """Initialize exception."""
-        super().__init__(
-            message=message, code=code or ErrorCode.AUTHENTICATION_ERROR, details=details
-        )
+    default_message: ClassVar[str] = "Authentication failed"
+    default_code: ClassVar[ErrorCode] = ErrorCode.AUTHENTICATION_ERROR
 
 
 class InvalidCredentialsException(AuthenticationException):
@@ -34,16 +28,8 @@ class InvalidCredentialsException(AuthenticationException):
         ```
     """
 
-    def __init__(
-        self,
-        message: str = "Invalid credentials",
-        code: ErrorCode | str | None = None,
-        details: dict[str, object] | None = None,
-    ) -> None:
-        """Initialize exception."""
-        super().__init__(
-            message=message, code=code or ErrorCode.INVALID_CREDENTIALS, details=details
-        )
+    default_message: ClassVar[str] = "Invalid credentials"
+    default_code: ClassVar[ErrorCode] = ErrorCode.INVALID_CREDENTIALS
 
 
 class InvalidTokenException(AuthenticationException):
@@ -59,14 +45,8 @@ class InvalidTokenException(AuthenticationException):
         ```
     """
 
-    def __init__(
-        self,
-        message: str = "Invalid token",
-        code: ErrorCode | str | None = None,
-        details: dict[str, object] | None = None,
-    ) -> None:
-        """Initialize exception."""
-        super().__init__(message=message, code=code or ErrorCode.INVALID_TOKEN, details=details)
+    default_message: ClassVar[str] = "Invalid token"
+    default_code: ClassVar[ErrorCode] = ErrorCode.INVALID_TOKEN
 
 
 class TokenExpiredException(AuthenticationException):
@@ -80,11 +60,5 @@ class TokenExpiredException(AuthenticationException):
         ```
     """
 
-    def __init__(
-        self,
-        message: str = "Token has expired",
-        code: ErrorCode | str | None = None,
-        details: dict[str, object] | None = None,
-    ) -> None:
-        """Initialize exception."""
-        super().__init__(message=message, code=code or ErrorCode.TOKEN_EXPIRED, details=details)
+    default_message: ClassVar[str] = "Token has expired"
+    default_code: ClassVar[ErrorCode] = ErrorCode.TOKEN_EXPIRED
@@ -1,29 +1,44 @@
 """Base exception classes."""
 
-from typing import override
+from functools import lru_cache
+from typing import ClassVar, override
+
+from pydantic_core import to_json
 
 from src.core.exceptions.codes import ErrorCode
 
 
+@lru_cache(maxsize=256)
+def _encode_without_details(code: str, message: str) -> bytes:
+    """Encode and cache an error payload that has no details."""
+    return to_json({"error": code, "message": message, "details": {}})
+
+
 class AppException(Exception):
     """
     Base exception for all application exceptions.
 
+    Subclasses set ``default_message`` and ``default_code`` instead of
+    overriding ``__init__``.
+
     Attributes:
         message: Error message
         code: Error code from ErrorCode enum
         details: Additional error details (optional)
     """
 
+    default_message: ClassVar[str] = "An unexpected error occurred"
+    default_code: ClassVar[ErrorCode] = ErrorCode.INTERNAL_SERVER_ERROR
+
     def __init__(
         self,
-        message: str,
+        message: str | None = None,
         code: ErrorCode | str | None = None,
         details: dict[str, object] | None = None,
     ) -> None:
         """Initialize exception."""
-        self.message: str = message
-        self.code: ErrorCode | str = code or ErrorCode(self.__class__.__name__)
+        self.message: str = message or self.default_message
+        self.code: ErrorCode | str = code or self.default_code
         self.details: dict[str, object] | None = details or {}
         super().__init__(self.message)
 
@@ -41,3 +56,14 @@ class AppException(Exception):
             "message": self.message,
             "details": self.details,
         }
+
+    def to_json(self) -> bytes:
+        """
+        Convert exception to JSON bytes.
+
+        Payloads without details are cached, so repeated errors of the same
+        kind skip encoding.
+        """
+        if not self.details:
+            return _encode_without_details(str(self.code), self.message)
+        return to_json(self.to_dict(), serialize_unknown=True)
@@ -1,5 +1,7 @@
 """Database-related exceptions."""
 
+from typing import ClassVar
+
 from src.core.exceptions.base import AppException
 from src.core.exceptions.codes import ErrorCode
 
@@ -11,14 +13,8 @@ class DatabaseException(AppException):
     Raised when a database operation fails.
     """
 
-    def __init__(
-        self,
-        message: str = "Database error",
-        code: ErrorCode | str | None = None,
-        details: dict[str, object] | None = None,
-    ) -> None:
-        """Initialize exception."""
-        super().__init__(message=message, code=code or ErrorCode.DATABASE_ERROR, details=details)
+    default_message: ClassVar[str] = "Database error"
+    default_code: ClassVar[ErrorCode] = ErrorCode.DATABASE_ERROR
 
 
 class RecordNotFoundException(DatabaseException):
@@ -33,14 +29,8 @@ class RecordNotFoundException(DatabaseException):
         ```
     """
 
-    def __init__(
-        self,
-        message: str = "Record not found",
-        code: ErrorCode | str | None = None,
-        details: dict[str, object] | None = None,
-    ) -> None:
-        """Initialize exception."""
-        super().__init__(message=message, code=code or ErrorCode.RECORD_NOT_FOUND, details=details)
+    default_message: ClassVar[str] = "Record not found"
+    default_code: ClassVar[ErrorCode] = ErrorCode.RECORD_NOT_FOUND
 
 
 class DuplicateRecordException(DatabaseException):
@@ -59,11 +49,5 @@ class DuplicateRecordException(DatabaseException):
         ```
     """
 
-    def __init__(
-        self,
-        message: str = "Record already exists",
-        code: ErrorCode | str | None = None,
-        details: dict[str, object] | None = None,
-    ) -> None:
-        """Initialize exception."""
-        super().__init__(message=message, code=code or ErrorCode.DUPLICATE_RECORD, details=details)
+    default_message: ClassVar[str] = "Record already exists"
+    default_code: ClassVar[ErrorCode] = ErrorCode.DUPLICATE_RECORD
@@ -1,10 +1,13 @@
 """Exception handlers for FastAPI."""
 
+from functools import lru_cache
+
 from fastapi import Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from loguru import logger
 from pydantic import ValidationError
+from pydantic_core import to_json
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from src.core.exceptions.auth import AuthenticationException
@@ -18,25 +21,60 @@ from src.core.exceptions.http import (
     UnauthorizedException,
 )
 
+_STATUS_BY_TYPE: dict[type[AppException], int] = {
+    BadRequestException: status.HTTP_400_BAD_REQUEST,
+    UnauthorizedException: status.HTTP_401_UNAUTHORIZED,
+    AuthenticationException: status.HTTP_401_UNAUTHORIZED,
+    ForbiddenException: status.HTTP_403_FORBIDDEN,
+    NotFoundException: status.HTTP_404_NOT_FOUND,
+    RecordNotFoundException: status.HTTP_404_NOT_FOUND,
+    DatabaseException: status.HTTP_500_INTERNAL_SERVER_ERROR,
+}
+
+_INTERNAL_ERROR_BODY = to_json(
+    {
+        "error": ErrorCode.INTERNAL_SERVER_ERROR,
+        "message": "An unexpected error occurred",
+        "details": {},
+    }
+)
+
+_HTTP_ERRORS: dict[int, tuple[ErrorCode, str]] = {
+    status.HTTP_400_BAD_REQUEST: (ErrorCode.BAD_REQUEST, "Invalid request"),
+    status.HTTP_401_UNAUTHORIZED: (ErrorCode.UNAUTHORIZED, "Authentication required"),
+    status.HTTP_403_FORBIDDEN: (ErrorCode.FORBIDDEN, "Access forbidden"),
+    status.HTTP_404_NOT_FOUND: (ErrorCode.NOT_FOUND, "Not found"),
+    status.HTTP_405_METHOD_NOT_ALLOWED: (ErrorCode.BAD_REQUEST, "Method not allowed"),
+}
+_HTTP_ERROR_FALLBACK = (ErrorCode.INTERNAL_SERVER_ERROR, "An unexpected error occurred")
+
+
+def _json_response(status_code: int, content: bytes) -> Response:
+    """Build a JSON response from pre-encoded bytes."""
+    return Response(content=content, status_code=status_code, media_type="application/json")
+
+
+@lru_cache
+def _status_for(exc_type: type[AppException]) -> int:
+    """
+    Resolve the HTTP status code for an exception type.
+
+    Walks the MRO so subclasses inherit their parent's status code.
+    """
+    for cls in exc_type.__mro__:
+        status_code = _STATUS_BY_TYPE.get(cls)
+        if status_code is not None:
+            return status_code
+    return status.HTTP_500_INTERNAL_SERVER_ERROR
+
 
-async def app_exception_handler(request: Request, exc: AppException) -> JSONResponse:
+async def app_exception_handler(request: Request, exc: AppException) -> Response:
     """
     Handle custom application exceptions.
 
     Maps exception types to appropriate HTTP status codes.
     """
-    status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
-
-    if isinstance(exc, (BadRequestException, RequestValidationError)):
-        status_code = status.HTTP_400_BAD_REQUEST
-    elif isinstance(exc, (UnauthorizedException, AuthenticationException)):
-        status_code = status.HTTP_401_UNAUTHORIZED
-    elif isinstance(exc, ForbiddenException):
-        status_code = status.HTTP_403_FORBIDDEN
-    elif isinstance(exc, (NotFoundException, RecordNotFoundException)):
-        status_code = status.HTTP_404_NOT_FOUND
-    elif isinstance(exc, DatabaseException):
-        status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    status_code = _status_for(type(exc))
 
     logger.error(
         f"Exception: {exc.__class__.__name__} - {exc.message}",
@@ -49,15 +87,12 @@ async def app_exception_handler(request: Request, exc: AppException) -> JSONResp
         },
     )
 
-    return JSONResponse(
-        status_code=status_code,
-        content=exc.to_dict(),
-    )
+    return _json_response(status_code, exc.to_json())
 
 
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError | ValidationError
-) -> JSONResponse:
+) -> Response:
     """
     Handle Pydantic validation errors.
 
@@ -72,43 +107,37 @@ async def validation_exception_handler(
         },
     )
 
-    return JSONResponse(
-        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content={
-            "error": ErrorCode.VALIDATION_ERROR,
-            "message": "Validation failed",
-            "details": {
-                "errors": exc.errors(),
+    return _json_response(
+        status.HTTP_422_UNPROCESSABLE_ENTITY,
+        to_json(
+            {
+                "error": ErrorCode.VALIDATION_ERROR,
+                "message": "Validation failed",
+                "details": {
+                    "errors": exc.errors(),
+                },
             },
-        },
+            serialize_unknown=True,
+        ),
     )
 
 
-async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> Response:
     """
     Handle Starlette HTTP exceptions (routing 404s, etc).
 
     Maps status codes to appropriate error codes and messages.
     """
-    error_map = {
-        status.HTTP_400_BAD_REQUEST: (ErrorCode.BAD_REQUEST, "Invalid request"),
-        status.HTTP_401_UNAUTHORIZED: (ErrorCode.UNAUTHORIZED, "Authentication required"),
-        status.HTTP_403_FORBIDDEN: (ErrorCode.FORBIDDEN, "Access forbidden"),
-        status.HTTP_404_NOT_FOUND: (
-            ErrorCode.NOT_FOUND,
-            f"Endpoint '{request.url.path}' not found",
-        ),
-        status.HTTP_405_METHOD_NOT_ALLOWED: (
-            ErrorCode.BAD_REQUEST,
-            f"Method {request.method} not allowed",
-        ),
-    }
+    error_code, default_message = _HTTP_ERRORS.get(exc.status_code, _HTTP_ERROR_FALLBACK)
 
-    error_code, default_message = error_map.get(
-        exc.status_code, (ErrorCode.INTERNAL_SERVER_ERROR, "An unexpected error occurred")
-    )
-
-    message = exc.detail if exc.detail and exc.detail != "Not Found" else default_message
+    if exc.detail and exc.detail != "Not Found":
+        message = exc.detail
+    elif exc.status_code == status.HTTP_404_NOT_FOUND:
+        message = f"Endpoint '{request.url.path}' not found"
+    elif exc.status_code == status.HTTP_405_METHOD_NOT_ALLOWED:
+        message = f"Method {request.method} not allowed"
+    else:
+        message = default_message
 
     logger.warning(
         f"HTTP {exc.status_code} on {request.method} {request.url.path}",
@@ -119,17 +148,13 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException)
         },
     )
 
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={
-            "error": error_code,
-            "message": message,
-            "details": {},
-        },
+    return _json_response(
+        exc.status_code,
+        to_json({"error": error_code, "message": message, "details": {}}),
     )
 
 
-async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def generic_exception_handler(request: Request, exc: Exception) -> Response:
     """
     Handle unexpected exceptions.
 
@@ -144,11 +169,4 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
         },
     )
 
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "error": ErrorCode.INTERNAL_SERVER_ERROR,
-            "message": "An unexpected error occurred",
-            "details": {},
-        },
-    )
+    return _json_response(status.HTTP_500_INTERNAL_SERVER_ERROR, _INTERNAL_ERROR_BODY)
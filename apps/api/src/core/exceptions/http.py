@@ -1,5 +1,7 @@
 """HTTP-related exceptions."""
 
+from typing import ClassVar
+
 from src.core.exceptions.base import AppException
 from src.core.exceptions.codes import ErrorCode
 
@@ -11,14 +13,8 @@ class BadRequestException(AppException):
     Raised when the request is malformed or invalid.
     """
 
-    def __init__(
-        self,
-        message: str = "Bad request",
-        code: ErrorCode | str | None = None,
-        details: dict[str, object] | None = None,
-    ) -> None:
-        """Initialize exception."""
-        super().__init__(message=message, code=code or ErrorCode.BAD_REQUEST, details=details)
+    default_message: ClassVar[str] = "Bad request"
+    default_code: ClassVar[ErrorCode] = ErrorCode.BAD_REQUEST
 
 
 class UnauthorizedException(AppException):
@@ -28,14 +24,8 @@ class UnauthorizedException(AppException):
     Raised when authentication is required but not provided or invalid.
     """
 
-    def __init__(
-        self,
-        message: str = "Unauthorized",
-        code: ErrorCode | str | None = None,
-        details: dict[str, object] | None = None,
-    ) -> None:
-        """Initialize exception."""
-        super().__init__(message=message, code=code or ErrorCode.UNAUTHORIZED, details=details)
+    default_message: ClassVar[str] = "Unauthorized"
+    default_code: ClassVar[ErrorCode] = ErrorCode.UNAUTHORIZED
 
 
 class ForbiddenException(AppException):
@@ -45,14 +35,8 @@ class ForbiddenException(AppException):
     Raised when the user is authenticated but doesn't have permission.
     """
 
-    def __init__(
-        self,
-        message: str = "Forbidden",
-        code: ErrorCode | str | None = None,
-        details: dict[str, object] | None = None,
-    ) -> None:
-        """Initialize exception."""
-        super().__init__(message=message, code=code or ErrorCode.FORBIDDEN, details=details)
+    default_message: ClassVar[str] = "Forbidden"
+    default_code: ClassVar[ErrorCode] = ErrorCode.FORBIDDEN
 
 
 class NotFoundException(AppException):
@@ -62,11 +46,5 @@ class NotFoundException(AppException):
     Raised when a requested resource is not found.
     """
 
-    def __init__(
-        self,
-        message: str = "Resource not found",
-        code: ErrorCode | str | None = None,
-        details: dict[str, object] | None = None,
-    ) -> None:
-        """Initialize exception."""
-        super().__init__(message=message, code=code or ErrorCode.NOT_FOUND, details=details)
+    default_message: ClassVar[str] = "Resource not found"
+    default_code: ClassVar[ErrorCode] = ErrorCode.NOT_FOUND
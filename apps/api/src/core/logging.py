@@ -9,6 +9,28 @@ from loguru import logger
 
 from src.core.settings import settings
 
+# Upper bound on stdlib logging frames skipped to find the caller
+_MAX_FRAME_WALK = 8
+
+# Lowest level any configured sink accepts, set by setup_logging(). Until
+# then nothing is filtered.
+_min_level_no: int = 0
+
+
+def is_level_enabled(level_no: int) -> bool:
+    """
+    Check whether any configured sink accepts records at a level.
+
+    Lets hot paths skip building log messages nobody will see.
+
+    Args:
+        level_no: Numeric log level (e.g. ``logger.level("INFO").no``)
+
+    Returns:
+        True if a record at ``level_no`` would be emitted
+    """
+    return level_no >= _min_level_no
+
 
 class InterceptHandler(logging.Handler):
     """
@@ -21,18 +43,25 @@ class InterceptHandler(logging.Handler):
     @override
     def emit(self, record: logging.LogRecord) -> None:
         """Emit a record using loguru."""
+        if not is_level_enabled(record.levelno):
+            return
+
         try:
             level = logger.level(record.levelname).name
         except ValueError:
             level = record.levelno
 
         frame = logging.currentframe()
-        depth = 2
-        while frame and frame.f_code.co_filename == logging.__file__:
+        depth = 0
+        for _ in range(_MAX_FRAME_WALK):
+            if frame is None or (depth > 0 and frame.f_code.co_filename != logging.__file__):
+                break
             frame = frame.f_back
             depth += 1
 
-        logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
+        logger.opt(depth=depth, exception=record.exc_info, lazy=True).log(
+            level, "{}", record.getMessage
+        )
 
 
 def setup_logging() -> None:
@@ -40,15 +69,24 @@ def setup_logging() -> None:
     Configure loguru logging.
 
     """
+    global _min_level_no
+
     logger.remove()
 
+    # Every sink below uses settings.log_level
+    _min_level_no = logger.level(settings.log_level).no
+
+    # Sinks are fed from a background queue (enqueue=True) so writes never
+    # block the event loop. File sinks stay line-buffered: loguru only flushes
+    # on close or rotation, so a larger buffer would lose records on a crash.
     _ = logger.add(
         sys.stderr,
         format=settings.log_format,
         level=settings.log_level,
         colorize=True,
-        backtrace=True,
+        backtrace=settings.debug,
         diagnose=settings.debug,
+        enqueue=settings.env != "test",
     )
 
     if settings.env != "test":
@@ -62,8 +100,10 @@ def setup_logging() -> None:
             rotation=settings.log_rotation,
             retention=settings.log_retention,
             compression="zip",
-            backtrace=True,
+            backtrace=settings.debug,
             diagnose=settings.debug,
+            enqueue=True,
+            catch=True,
         )
 
         if settings.env == "production":
@@ -75,6 +115,10 @@ def setup_logging() -> None:
                 retention=settings.log_retention,
                 compression="zip",
                 serialize=True,
+                backtrace=settings.debug,
+                diagnose=settings.debug,
+                enqueue=True,
+                catch=True,
             )
 
     logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
@@ -4,12 +4,18 @@ from src.core.security.password import (
     PasswordHasher,
     create_hasher_from_settings,
     hash_password,
+    hash_password_async,
+    password_needs_update,
     verify_password,
+    verify_password_async,
 )
 
 __all__ = [
     "PasswordHasher",
     "create_hasher_from_settings",
     "hash_password",
+    "hash_password_async",
+    "password_needs_update",
     "verify_password",
+    "verify_password_async",
 ]
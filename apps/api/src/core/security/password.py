@@ -1,11 +1,27 @@
 """Password hashing and verification using Argon2id."""
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import ClassVar
 
-from passlib.context import CryptContext
+from argon2 import PasswordHasher as Argon2Hasher
+from argon2 import Type
 
 from src.core.settings import settings
 
+# Anything not shaped like an Argon2 hash is rejected before running the
+# (deliberately expensive) verification. The format is public, so checking
+# it up front leaks nothing about the password or hash.
+_ARGON2_PREFIXES = ("$argon2id$", "$argon2i$", "$argon2d$")
+_MIN_HASH_LENGTH = 40
+
+# Named (time_cost, memory_cost, parallelism) presets for PASSWORD_PROFILE
+_PROFILES: dict[str, tuple[int, int, int]] = {
+    "owasp_m46": (1, 47104, 1),  # OWASP: 46 MiB, t=1, p=1
+}
+
 
 class PasswordHasher:
     """
@@ -28,7 +44,9 @@ class PasswordHasher:
 
     DEFAULT_TIME_COST: ClassVar[int] = 2
     DEFAULT_MEMORY_COST: ClassVar[int] = 102400
-    DEFAULT_PARALLELISM: ClassVar[int] = 8
+    # Fixed rather than derived from the host: parallelism is stored in each
+    # hash, so replicas with different core counts must agree on it.
+    DEFAULT_PARALLELISM: ClassVar[int] = 4
     DEFAULT_HASH_LENGTH: ClassVar[int] = 32
     DEFAULT_SALT_LENGTH: ClassVar[int] = 16
 
@@ -47,7 +65,7 @@ class PasswordHasher:
         Args:
             time_cost: Number of iterations (default: 2)
             memory_cost: Memory usage in KB (default: 102400 = 100 MB)
-            parallelism: Number of parallel threads (default: 8)
+            parallelism: Number of parallel lanes (default: 4)
             hash_length: Length of hash in bytes (default: 32)
             salt_length: Length of salt in bytes (default: 16)
 
@@ -55,7 +73,7 @@ class PasswordHasher:
             Higher values increase security but also increase computation time:
             - time_cost: Linear impact on time
             - memory_cost: Linear impact on memory usage
-            - parallelism: More threads = faster, but diminishing returns
+            - parallelism: More lanes = faster, but only up to the available cores
         """
         self.time_cost: int = time_cost or self.DEFAULT_TIME_COST
         self.memory_cost: int = memory_cost or self.DEFAULT_MEMORY_COST
@@ -63,15 +81,13 @@ class PasswordHasher:
         self.hash_length: int = hash_length or self.DEFAULT_HASH_LENGTH
         self.salt_length: int = salt_length or self.DEFAULT_SALT_LENGTH
 
-        self._context: CryptContext = CryptContext(
-            schemes=["argon2"],
-            deprecated="auto",
-            argon2__type="id",
-            argon2__time_cost=self.time_cost,
-            argon2__memory_cost=self.memory_cost,
-            argon2__parallelism=self.parallelism,
-            argon2__hash_len=self.hash_length,
-            argon2__salt_size=self.salt_length,
+        self._hasher: Argon2Hasher = Argon2Hasher(
+            time_cost=self.time_cost,
+            memory_cost=self.memory_cost,
+            parallelism=self.parallelism,
+            hash_len=self.hash_length,
+            salt_len=self.salt_length,
+            type=Type.ID,
         )
 
     def hash(self, password: str) -> str:
@@ -97,7 +113,7 @@ class PasswordHasher:
         if not password:
             raise ValueError("Password cannot be empty")
 
-        return self._context.hash(password)
+        return self._hasher.hash(password)
 
     def verify(self, password: str, hashed: str) -> bool:
         """
@@ -119,8 +135,11 @@ class PasswordHasher:
         if not password or not hashed:
             return False
 
+        if len(hashed) < _MIN_HASH_LENGTH or not hashed.startswith(_ARGON2_PREFIXES):
+            return False
+
         try:
-            return self._context.verify(password, hashed)
+            return self._hasher.verify(hashed, password)
         except Exception:
             return False
 
@@ -146,7 +165,7 @@ class PasswordHasher:
             ```
         """
         try:
-            return self._context.needs_update(hashed)
+            return self._hasher.check_needs_rehash(hashed)
         except Exception:
             return True
 
@@ -178,16 +197,30 @@ class PasswordHasher:
                     await session.commit()
             ```
         """
-        try:
-            is_valid, new_hash = self._context.verify_and_update(password, hashed)
-            return is_valid, new_hash
-        except Exception:
+        if not self.verify(password, hashed):
             return False, None
 
+        if self.needs_update(hashed):
+            return True, self.hash(password)
+
+        return True, None
+
+
+@lru_cache(maxsize=8)
+def _hasher_for(time_cost: int, memory_cost: int, parallelism: int) -> PasswordHasher:
+    """Get a shared PasswordHasher for the given parameters."""
+    return PasswordHasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+
 
 def create_hasher_from_settings() -> PasswordHasher:
     """
-    Create a PasswordHasher instance from application settings.
+    Get the PasswordHasher configured by application settings.
+
+    A named PASSWORD_PROFILE takes precedence over the individual
+    PASSWORD_ARGON2_* settings.
+
+    Hashers hold no per-call state, so one instance is shared per
+    parameter set instead of building a new one on every call.
 
     Returns:
         Configured PasswordHasher instance
@@ -200,14 +233,25 @@ def create_hasher_from_settings() -> PasswordHasher:
         hashed = hasher.hash("password")
         ```
     """
-    return PasswordHasher(
-        time_cost=settings.password_argon2_time_cost,
-        memory_cost=settings.password_argon2_memory_cost,
-        parallelism=settings.password_argon2_parallelism,
+    profile = _PROFILES.get(settings.password_profile)
+    if profile is not None:
+        return _hasher_for(*profile)
+
+    return _hasher_for(
+        settings.password_argon2_time_cost,
+        settings.password_argon2_memory_cost,
+        settings.password_argon2_parallelism,
     )
 
 
-default_hasher = PasswordHasher()
+default_hasher = create_hasher_from_settings()
+
+# Each hash already runs `parallelism` lanes, so cap concurrent hashes to keep
+# the total number of lanes within the available cores.
+_hash_executor = ThreadPoolExecutor(
+    max_workers=max(1, (os.cpu_count() or 1) // default_hasher.parallelism),
+    thread_name_prefix="argon2",
+)
 
 
 def hash_password(password: str) -> str:
@@ -229,6 +273,8 @@ def hash_password(password: str) -> str:
         hashed = hash_password("my_password")
         ```
     """
+    # No pre-hash: Argon2 has no input length limit and already compresses the
+    # password with BLAKE2b, so cost doesn't depend on password length.
     return default_hasher.hash(password)
 
 
@@ -254,3 +300,75 @@ def verify_password(password: str, hashed: str) -> bool:
         ```
     """
     return default_hasher.verify(password, hashed)
+
+
+def password_needs_update(hashed: str) -> bool:
+    """
+    Check if a hash was made with different parameters than the current ones.
+
+    Cheap: only parses the hash, no Argon2 work is done.
+
+    Args:
+        hashed: Hashed password
+
+    Returns:
+        True if the password should be rehashed
+
+    Example:
+        ```python
+        from src.core.security import password_needs_update
+
+        if password_needs_update(user.hashed_password):
+            user.hashed_password = await hash_password_async(password)
+        ```
+    """
+    return default_hasher.needs_update(hashed)
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password without blocking the event loop.
+
+    Runs the hash on a dedicated thread pool. Argon2 releases the GIL, so
+    other requests keep being served while it runs.
+
+    Args:
+        password: Plain text password
+
+    Returns:
+        Hashed password
+
+    Example:
+        ```python
+        from src.core.security import hash_password_async
+
+        hashed = await hash_password_async("my_password")
+        ```
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_executor, default_hasher.hash, password)
+
+
+async def verify_password_async(password: str, hashed: str) -> bool:
+    """
+    Verify a password without blocking the event loop.
+
+    Runs the verification on a dedicated thread pool.
+
+    Args:
+        password: Plain text password
+        hashed: Hashed password
+
+    Returns:
+        True if password matches hash
+
+    Example:
+        ```python
+        from src.core.security import verify_password_async
+
+        if await verify_password_async("my_password", user.hashed_password):
+            pass
+        ```
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_executor, default_hasher.verify, password, hashed)
@@ -1,5 +1,5 @@
-from functools import lru_cache
-from typing import ClassVar
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, ClassVar, Literal
 
 from pydantic import Field, PostgresDsn
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -29,24 +29,44 @@ class Settings(BaseSettings):
 
     # Database
     database_url: PostgresDsn = Field(default=..., validation_alias="DATABASE_URL")
+    db_pool_size: int = Field(default=10, validation_alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=20, validation_alias="DB_MAX_OVERFLOW")
+    db_pool_recycle: int = Field(default=1800, validation_alias="DB_POOL_RECYCLE")
+    db_pool_timeout: float = Field(default=30.0, validation_alias="DB_POOL_TIMEOUT")
+    db_pool_pre_ping: bool = Field(default=False, validation_alias="DB_POOL_PRE_PING")
+    db_pgbouncer: bool = Field(default=False, validation_alias="DB_PGBOUNCER")
+    db_statement_cache_size: int = Field(default=1024, validation_alias="DB_STATEMENT_CACHE_SIZE")
+    db_query_cache_size: int = Field(default=500, validation_alias="DB_QUERY_CACHE_SIZE")
+    db_connect_timeout: float = Field(default=10.0, validation_alias="DB_CONNECT_TIMEOUT")
+    db_tcp_keepalives_idle: int = Field(default=60, validation_alias="DB_TCP_KEEPALIVES_IDLE")
+
+    # Health Check
+    health_cache_ttl: float = Field(default=5.0, validation_alias="HEALTH_CACHE_TTL")
+    health_db_timeout: float = Field(default=3.0, validation_alias="HEALTH_DB_TIMEOUT")
 
     # Security
     secret_key: str = Field(default=..., validation_alias="SECRET_KEY")
+    trusted_hosts: list[str] = Field(default=["*"], validation_alias="TRUSTED_HOSTS")
     algorithm: str = Field(default="HS256", validation_alias="ALGORITHM")
     access_token_expire_minutes: int = Field(
         default=30, validation_alias="ACCESS_TOKEN_EXPIRE_MINUTES"
     )
 
     # Password Hashing
+    password_profile: Literal["custom", "owasp_m46"] = Field(
+        default="custom", validation_alias="PASSWORD_PROFILE"
+    )
     password_argon2_time_cost: int = Field(default=2, validation_alias="PASSWORD_ARGON2_TIME_COST")
     password_argon2_memory_cost: int = Field(
         default=102400, validation_alias="PASSWORD_ARGON2_MEMORY_COST"
     )
     password_argon2_parallelism: int = Field(
-        default=8, validation_alias="PASSWORD_ARGON2_PARALLELISM"
+        default=4, validation_alias="PASSWORD_ARGON2_PARALLELISM"
     )
+    session_cache_enabled: bool = Field(default=True, validation_alias="SESSION_CACHE_ENABLED")
+    session_cache_ttl: float = Field(default=30.0, validation_alias="SESSION_CACHE_TTL")
 
-    @property
+    @cached_property
     def async_database_url(self) -> str:
         """Get async database URL."""
         return str(self.database_url)
@@ -58,4 +78,12 @@ def get_settings() -> Settings:
     return Settings()
 
 
-settings = get_settings()
+if TYPE_CHECKING:
+    settings: Settings
+
+
+def __getattr__(name: str) -> Settings:
+    """Build ``settings`` on first access rather than at import time."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
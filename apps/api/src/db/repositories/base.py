@@ -1,9 +1,11 @@
 """Base repository for database operations."""
 
-from typing import TYPE_CHECKING
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Self
 from uuid import UUID
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import any_, bindparam, delete, exists, func, insert, inspect, select
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import InstrumentedAttribute
 
@@ -13,6 +15,12 @@ if TYPE_CHECKING:
     from sqlalchemy.sql import Select
     from sqlalchemy.sql.elements import UnaryExpression
 
+# Maximum number of IDs sent in a single get_many query
+_GET_MANY_BATCH_SIZE = 1000
+
+# Mapped column attributes per model, built on first lookup
+_column_cache: dict[type[Base], dict[str, InstrumentedAttribute[object]]] = {}
+
 
 class BaseRepository[ModelType: Base]:
     """
@@ -44,6 +52,32 @@ class BaseRepository[ModelType: Base]:
         self.model: type[ModelType] = model
         self.session: AsyncSession = session
 
+    @classmethod
+    def for_session(cls, session: AsyncSession) -> Self:
+        """
+        Get the repository for a session, creating it on first use.
+
+        The instance is stored in ``session.info``, so services built on the
+        same session share it. Only for subclasses whose constructor takes
+        just the session.
+
+        Args:
+            session: Async database session
+
+        Returns:
+            Repository bound to ``session``
+
+        Example:
+            ```python
+            repository = UserRepository.for_session(session)
+            ```
+        """
+        repository = session.info.get(cls)
+        if repository is None:
+            repository = cls(session)  # pyright: ignore[reportCallIssue]
+            session.info[cls] = repository
+        return repository
+
     async def get(self, id: UUID) -> ModelType | None:
         """
         Get a single record by ID.
@@ -56,13 +90,42 @@ class BaseRepository[ModelType: Base]:
         """
         return await self.session.get(self.model, id)
 
+    async def get_many(self, ids: Sequence[UUID]) -> list[ModelType | None]:
+        """
+        Get multiple records by ID in a single round-trip.
+
+        IDs are sent as one array parameter (``id = ANY($1)``), so the
+        statement is the same regardless of how many IDs are passed.
+
+        Args:
+            ids: Record UUIDs
+
+        Returns:
+            Model instances in the same order as ``ids``, None where not found
+        """
+        if not ids:
+            return []
+
+        id_column = self.__get_column("id")
+        query = select(self.model).where(
+            id_column == any_(bindparam("ids", type_=ARRAY(id_column.type)))
+        )
+
+        by_id: dict[object, ModelType] = {}
+        for start in range(0, len(ids), _GET_MANY_BATCH_SIZE):
+            batch = list(ids[start : start + _GET_MANY_BATCH_SIZE])
+            result = await self.session.execute(query, {"ids": batch})
+            by_id.update((obj.id, obj) for obj in result.scalars())  # pyright: ignore[reportAttributeAccessIssue]
+
+        return [by_id.get(id) for id in ids]
+
     async def get_multi(
         self,
         *,
         skip: int = 0,
         limit: int = 100,
         order_by: UnaryExpression[object] | str | None = None,
-    ) -> list[ModelType]:
+    ) -> Sequence[ModelType]:
         """
         Get multiple records with pagination.
 
@@ -83,7 +146,7 @@ class BaseRepository[ModelType: Base]:
                 query = query.order_by(order_by)
 
         result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def create(self, obj: ModelType) -> ModelType:
         """
@@ -97,13 +160,38 @@ class BaseRepository[ModelType: Base]:
         """
         self.session.add(obj)
         await self.session.flush()
-        await self.session.refresh(obj)
         return obj
 
+    async def create_many(self, values: Sequence[Mapping[str, object]]) -> Sequence[ModelType]:
+        """
+        Create multiple records in a single INSERT.
+
+        Rows are sent as one batched ``INSERT ... RETURNING`` and the
+        created instances, including server-generated columns, come back
+        from the same round-trip.
+
+        Args:
+            values: Column values for each record
+
+        Returns:
+            Created model instances, in the same order as ``values``
+        """
+        if not values:
+            return []
+
+        result = await self.session.scalars(
+            insert(self.model).returning(self.model, sort_by_parameter_order=True), values
+        )
+        return result.all()
+
     async def update(self, obj: ModelType) -> ModelType:
         """
         Update an existing record.
 
+        Flushes the pending changes as ``UPDATE ... WHERE id = :id``, with
+        server-generated columns returned by the same statement; the row is
+        not re-selected. Call it on an instance loaded in this session.
+
         Args:
             obj: Model instance to update
 
@@ -111,25 +199,26 @@ class BaseRepository[ModelType: Base]:
             Updated model instance
         """
         await self.session.flush()
-        await self.session.refresh(obj)
         return obj
 
     async def delete(self, id: UUID) -> bool:
         """
         Delete a record by ID.
 
+        Issues a single DELETE statement, so ORM-level cascades are not
+        applied; related rows must be removed by ``ON DELETE CASCADE``
+        foreign keys.
+
         Args:
             id: Record UUID
 
         Returns:
             True if deleted, False if not found
         """
-        obj = await self.get(id)
-        if obj:
-            await self.session.delete(obj)
-            await self.session.flush()
-            return True
-        return False
+        id_column = self.__get_column("id")
+        result = await self.session.execute(delete(self.model).where(id_column == id))
+        await self.session.flush()
+        return bool(getattr(result, "rowcount", 0))
 
     async def exists(self, id: UUID) -> bool:
         """
@@ -142,8 +231,8 @@ class BaseRepository[ModelType: Base]:
             True if exists, False otherwise
         """
         id_column = self.__get_column("id")
-        result = await self.session.execute(select(id_column).where(id_column == id))
-        return result.scalar_one_or_none() is not None
+        result = await self.session.execute(select(exists().where(id_column == id)))
+        return result.scalar_one()
 
     async def count(self, query: Select[tuple[object, ...]] | None = None) -> int:
         """
@@ -180,7 +269,7 @@ class BaseRepository[ModelType: Base]:
 
     async def get_multi_by_field(
         self, field: str, value: object, *, skip: int = 0, limit: int = 100
-    ) -> list[ModelType]:
+    ) -> Sequence[ModelType]:
         """
         Get multiple records by field value.
 
@@ -198,7 +287,7 @@ class BaseRepository[ModelType: Base]:
         result = await self.session.execute(
             select(self.model).where(field_column == value).offset(skip).limit(limit)
         )
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def delete_by_field(self, field: str, value: object) -> int:
         """
@@ -226,7 +315,15 @@ class BaseRepository[ModelType: Base]:
         Returns:
             Column
         """
-        col = getattr(self.model, column, None)
-        if col is None or not isinstance(col, InstrumentedAttribute):
-            raise ValueError(f"Model does not have a column named {column}")
-        return col
+        columns = _column_cache.get(self.model)
+        if columns is None:
+            columns = {
+                attr.key: getattr(self.model, attr.key)  # pyright: ignore[reportAny]
+                for attr in inspect(self.model).column_attrs
+            }
+            _column_cache[self.model] = columns
+
+        try:
+            return columns[column]
+        except KeyError:
+            raise ValueError(f"Model does not have a column named {column}") from None
@@ -1,14 +1,23 @@
 """Session repository."""
 
-from datetime import UTC, datetime
+from collections.abc import Sequence
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import bindparam, delete, func, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.repositories.base import BaseRepository
 from src.models.session import Session
 
+# Hot lookups are built once; only the bound values change per call
+_SELECT_BY_TOKEN = select(Session).where(Session.token == bindparam("token"))
+_SELECT_ACTIVE_BY_TOKEN = (
+    select(Session)
+    .where(Session.token == bindparam("token"))
+    .where(Session.expires_at > func.now())
+    .where(Session.revoked_at.is_(None))
+)
+
 
 class SessionRepository(BaseRepository[Session]):
     """
@@ -31,7 +40,7 @@ class SessionRepository(BaseRepository[Session]):
         Returns:
             Session or None if not found
         """
-        result = await self.session.execute(select(Session).where(Session.token == token))
+        result = await self.session.execute(_SELECT_BY_TOKEN, {"token": token})
         return result.scalar_one_or_none()
 
     async def get_user_sessions(
@@ -40,7 +49,7 @@ class SessionRepository(BaseRepository[Session]):
         *,
         include_expired: bool = False,
         include_revoked: bool = False,
-    ) -> list[Session]:
+    ) -> Sequence[Session]:
         """
         Get all sessions for a user.
 
@@ -55,7 +64,7 @@ class SessionRepository(BaseRepository[Session]):
         query = select(Session).where(Session.user_id == user_id)
 
         if not include_expired:
-            query = query.where(Session.expires_at > datetime.now(UTC))
+            query = query.where(Session.expires_at > func.now())
 
         if not include_revoked:
             query = query.where(Session.revoked_at.is_(None))
@@ -63,7 +72,7 @@ class SessionRepository(BaseRepository[Session]):
         query = query.order_by(Session.created_at.desc())
 
         result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def get_active_session_by_token(self, token: str) -> Session | None:
         """
@@ -75,12 +84,7 @@ class SessionRepository(BaseRepository[Session]):
         Returns:
             Session or None if not found or invalid
         """
-        result = await self.session.execute(
-            select(Session)
-            .where(Session.token == token)
-            .where(Session.expires_at > datetime.now(UTC))
-            .where(Session.revoked_at.is_(None))
-        )
+        result = await self.session.execute(_SELECT_ACTIVE_BY_TOKEN, {"token": token})
         return result.scalar_one_or_none()
 
     async def revoke_session(self, token: str) -> bool:
@@ -91,15 +95,20 @@ class SessionRepository(BaseRepository[Session]):
             token: Session token
 
         Returns:
-            True if session was revoked, False if not found
+            True if session was revoked, False if not found or already revoked
         """
-        session_obj = await self.get_by_token(token)
-        if not session_obj:
-            return False
+        result = await self.session.execute(
+            update(Session)
+            .where(Session.token == token)
+            .where(Session.revoked_at.is_(None))
+            .values(revoked_at=func.now())
+            .returning(literal(1))
+            .execution_options(synchronize_session=False)
+        )
+        revoked = result.scalar_one_or_none() is not None
 
-        session_obj.revoke()
         await self.session.flush()
-        return True
+        return revoked
 
     async def revoke_user_sessions(self, user_id: UUID) -> int:
         """
@@ -111,15 +120,17 @@ class SessionRepository(BaseRepository[Session]):
         Returns:
             Number of sessions revoked
         """
-        sessions = await self.get_user_sessions(
-            user_id, include_expired=False, include_revoked=False
+        result = await self.session.execute(
+            update(Session)
+            .where(Session.user_id == user_id)
+            .where(Session.expires_at > func.now())
+            .where(Session.revoked_at.is_(None))
+            .values(revoked_at=func.now())
+            .execution_options(synchronize_session=False)
         )
 
-        for session_obj in sessions:
-            session_obj.revoke()
-
         await self.session.flush()
-        return len(sessions)
+        return getattr(result, "rowcount", 0) or 0
 
     async def cleanup_expired_sessions(self) -> int:
         """
@@ -128,10 +139,10 @@ class SessionRepository(BaseRepository[Session]):
         Returns:
             Number of sessions deleted
         """
-        now = datetime.now(UTC)
-
         result = await self.session.execute(
-            delete(Session).where((Session.expires_at < now) | (Session.revoked_at.is_not(None)))
+            delete(Session)
+            .where((Session.expires_at < func.now()) | (Session.revoked_at.is_not(None)))
+            .execution_options(synchronize_session=False)
         )
 
         await self.session.flush()
@@ -1,11 +1,39 @@
 """User repository."""
 
-from sqlalchemy import func, select
+from collections.abc import Sequence
+from uuid import UUID
+
+from sqlalchemy import bindparam, exists, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.cache import TTLCache
 from src.db.repositories.base import BaseRepository
 from src.models.user import User
 
+# Hot lookups are built once; only the bound values change per call
+_SELECT_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+_SELECT_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+_EMAIL_EXISTS = select(exists().where(User.email == bindparam("email")))
+_USERNAME_EXISTS = select(exists().where(User.username == bindparam("username")))
+
+# NULL never compares equal, so either value may be passed as None
+_FIND_CONFLICTS = (
+    select(
+        func.bool_or(User.email == bindparam("email")),
+        func.bool_or(User.username == bindparam("username")),
+    )
+    .where(or_(User.email == bindparam("email"), User.username == bindparam("username")))
+    .where(
+        or_(
+            bindparam("exclude_id", type_=User.id.type).is_(None),
+            User.id != bindparam("exclude_id", type_=User.id.type),
+        )
+    )
+)
+
+# Shared across sessions; a dashboard-grade count doesn't need to be live
+_active_users_count: TTLCache[str, int] = TTLCache(maxsize=1, ttl=60)
+
 
 class UserRepository(BaseRepository[User]):
     """
@@ -31,7 +59,7 @@ class UserRepository(BaseRepository[User]):
         Returns:
             User instance or None if not found
         """
-        result = await self.session.execute(select(User).where(User.email == email))
+        result = await self.session.execute(_SELECT_BY_EMAIL, {"email": email})
         return result.scalar_one_or_none()
 
     async def get_by_username(self, username: str) -> User | None:
@@ -44,10 +72,10 @@ class UserRepository(BaseRepository[User]):
         Returns:
             User instance or None if not found
         """
-        result = await self.session.execute(select(User).where(User.username == username))
+        result = await self.session.execute(_SELECT_BY_USERNAME, {"username": username})
         return result.scalar_one_or_none()
 
-    async def get_active_users(self, *, skip: int = 0, limit: int = 100) -> list[User]:
+    async def get_active_users(self, *, skip: int = 0, limit: int = 100) -> Sequence[User]:
         """
         Get all active users (is_active=True).
 
@@ -66,9 +94,9 @@ class UserRepository(BaseRepository[User]):
             .limit(limit)
             .order_by(User.created_at.desc())
         )
-        return list(result.scalars().all())
+        return result.scalars().all()
 
-    async def get_superusers(self, *, skip: int = 0, limit: int = 100) -> list[User]:
+    async def get_superusers(self, *, skip: int = 0, limit: int = 100) -> Sequence[User]:
         """
         Get all superusers (is_superuser=True).
 
@@ -87,7 +115,7 @@ class UserRepository(BaseRepository[User]):
             .limit(limit)
             .order_by(User.created_at.desc())
         )
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def email_exists(self, email: str) -> bool:
         """
@@ -99,8 +127,8 @@ class UserRepository(BaseRepository[User]):
         Returns:
             True if email exists, False otherwise
         """
-        result = await self.session.execute(select(User.id).where(User.email == email))
-        return result.scalar_one_or_none() is not None
+        result = await self.session.execute(_EMAIL_EXISTS, {"email": email})
+        return result.scalar_one()
 
     async def username_exists(self, username: str) -> bool:
         """
@@ -112,20 +140,68 @@ class UserRepository(BaseRepository[User]):
         Returns:
             True if username exists, False otherwise
         """
-        result = await self.session.execute(select(User.id).where(User.username == username))
-        return result.scalar_one_or_none() is not None
+        result = await self.session.execute(_USERNAME_EXISTS, {"username": username})
+        return result.scalar_one()
+
+    async def find_conflicts(
+        self,
+        *,
+        email: str | None = None,
+        username: str | None = None,
+        exclude_id: UUID | None = None,
+    ) -> tuple[bool, bool]:
+        """
+        Check whether an email and/or username are taken, in one query.
+
+        Args:
+            email: Email address to check
+            username: Username to check
+            exclude_id: User ID to ignore (the user being updated)
+
+        Returns:
+            Tuple of (email taken, username taken)
+
+        Example:
+            ```python
+            email_taken, username_taken = await repo.find_conflicts(
+                email=email, username=username
+            )
+            ```
+        """
+        if not email and not username:
+            return False, False
+
+        result = await self.session.execute(
+            _FIND_CONFLICTS,
+            {"email": email or None, "username": username or None, "exclude_id": exclude_id},
+        )
+        email_taken, username_taken = result.one()
+        return bool(email_taken), bool(username_taken)
 
-    async def count_active_users(self) -> int:
+    async def count_active_users(self, *, exact: bool = False) -> int:
         """
         Count all active users.
 
+        The count is cached for up to a minute, since it scans every active
+        row. Pass ``exact=True`` to bypass the cache.
+
+        Args:
+            exact: Always query the database
+
         Returns:
             Number of active users
         """
+        if not exact:
+            cached = _active_users_count.get("active")
+            if cached is not None:
+                return cached
+
         result = await self.session.execute(
             select(func.count())
             .select_from(User)
             .where(User.is_active.is_(True))
             .where(User.deleted_at.is_(None))
         )
-        return result.scalar_one()
+        count = result.scalar_one()
+        _active_users_count.set("active", count)
+        return count
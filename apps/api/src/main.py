@@ -18,7 +18,7 @@ from src.core.exceptions.handlers import (
     validation_exception_handler,
 )
 from src.core.settings import settings
-from src.middleware import LoggingMiddleware, TimingMiddleware
+from src.middleware import RequestObservabilityMiddleware
 
 
 def create_app() -> FastAPI:
@@ -38,22 +38,24 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
-    if not settings.debug:
+    # Middleware that would not change any response is left out entirely,
+    # since each one adds a layer to every request.
+    if not settings.debug and "*" not in settings.trusted_hosts:
         app.add_middleware(
             TrustedHostMiddleware,  # type: ignore[arg-type]
-            allowed_hosts=["*"],
+            allowed_hosts=settings.trusted_hosts,
         )
 
-    app.add_middleware(
-        CORSMiddleware,  # type: ignore[arg-type]
-        allow_origins=["*"] if settings.debug else [],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    if settings.debug:
+        app.add_middleware(
+            CORSMiddleware,  # type: ignore[arg-type]
+            allow_origins=["*"],
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
 
-    app.add_middleware(TimingMiddleware)  # type: ignore[arg-type]
-    app.add_middleware(LoggingMiddleware)  # type: ignore[arg-type]
+    app.add_middleware(RequestObservabilityMiddleware)  # type: ignore[arg-type]
 
     # Exception handlers
     app.add_exception_handler(AppException, app_exception_handler)  # type: ignore[invalid-argument-type]  # pyright: ignore[reportArgumentType]
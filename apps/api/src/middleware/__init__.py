@@ -1,9 +1,7 @@
 """Custom middleware for the application."""
 
-from src.middleware.logging import LoggingMiddleware
-from src.middleware.timing import TimingMiddleware
+from src.middleware.observability import RequestObservabilityMiddleware
 
 __all__ = [
-    "LoggingMiddleware",
-    "TimingMiddleware",
+    "RequestObservabilityMiddleware",
 ]
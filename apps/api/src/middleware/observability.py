@@ -0,0 +1,119 @@
+"""Request logging and timing middleware."""
+
+import time
+from os import urandom
+
+from loguru import logger
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.context import request_id_var
+from src.core.logging import is_level_enabled
+
+# Requests taking longer than this are logged as warnings
+_SLOW_REQUEST_SECONDS = 1.0
+
+# Docs assets and probes are passed through without logging or timing
+_SKIP_PREFIXES = ("/docs", "/redoc", "/openapi.json", "/v1/health", "/v1/live")
+
+_INFO_LEVEL_NO = logger.level("INFO").no
+
+
+class RequestObservabilityMiddleware:
+    """
+    Middleware for logging and timing HTTP requests.
+
+    Assigns a request ID, logs each request and response, warns about slow
+    requests (> 1 second) and adds ``X-Request-ID`` / ``X-Process-Time``
+    response headers, all in a single pass. API docs and health probes are
+    not instrumented.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Initialize middleware.
+
+        Args:
+            app: Next ASGI application
+        """
+        self.app: ASGIApp = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process request, log details and track timing."""
+        if scope["type"] != "http" or scope["path"].startswith(_SKIP_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        method: str = scope["method"]
+        path: str = scope["path"]
+
+        request_id = urandom(16).hex()
+        request_id_header = (b"x-request-id", request_id.encode("ascii"))
+        scope.setdefault("state", {})["request_id"] = request_id
+        _ = request_id_var.set(request_id)
+
+        # Checked per request since setup_logging() can change the level at startup
+        info_enabled = is_level_enabled(_INFO_LEVEL_NO)
+
+        log = logger.bind(request_id=request_id, method=method, path=path)
+        if info_enabled:
+            client = scope.get("client")
+            query_string: bytes = scope["query_string"]
+            log.info(
+                "→ {} {}",
+                method,
+                path,
+                query=query_string.decode("latin-1") if query_string else "",
+                client=client[0] if client else None,
+            )
+
+        start_time = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                process_time = f"{time.perf_counter() - start_time:.4f}".encode("ascii")
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    request_id_header,
+                    (b"x-process-time", process_time),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            process_time = time.perf_counter() - start_time
+            log.error(
+                "✗ {} {} - ERROR ({:.4f}s): {}",
+                method,
+                path,
+                process_time,
+                e,
+                error=str(e),
+                process_time=process_time,
+            )
+            raise
+
+        process_time = time.perf_counter() - start_time
+        if info_enabled:
+            log.info(
+                "← {} {} - {} ({:.4f}s)",
+                method,
+                path,
+                status_code,
+                process_time,
+                status_code=status_code,
+                process_time=process_time,
+            )
+
+        if process_time > _SLOW_REQUEST_SECONDS:
+            log.warning(
+                "Slow request detected: {} {} took {:.2f}s",
+                method,
+                path,
+                process_time,
+                duration=process_time,
+                slow_request=True,
+            )
@@ -1,10 +1,17 @@
 """Base model class with auto tablename generation."""
 
 import re
-from typing import override
+from collections.abc import Callable
+from operator import attrgetter
+from typing import ClassVar, override
 
 from sqlalchemy.orm import DeclarativeBase, declared_attr
 
+from src.core.settings import get_settings
+
+_CAMEL_WORD = re.compile("(.)([A-Z][a-z]+)")
+_CAMEL_BOUNDARY = re.compile("([a-z0-9])([A-Z])")
+
 
 class Base(DeclarativeBase):
     """
@@ -13,6 +20,29 @@ class Base(DeclarativeBase):
 
     __abstract__: bool = True
 
+    # Fetch server-generated values with INSERT/UPDATE ... RETURNING during
+    # flush, so freshly written objects don't need a refresh() round-trip
+    __mapper_args__: ClassVar[dict[str, object]] = {"eager_defaults": True}
+
+    # Column names and a getter returning their values, set per mapped class
+    _column_names: ClassVar[tuple[str, ...]] = ()
+    _column_values: ClassVar[Callable[[object], tuple[object, ...]]] = staticmethod(lambda _: ())
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Cache column names once the subclass has been mapped."""
+        super().__init_subclass__(**kwargs)
+
+        table = cls.__dict__.get("__table__")
+        if table is None:
+            return
+
+        names = tuple(str(c.name) for c in table.columns)
+        getter = attrgetter(*names)
+        cls._column_names = names
+        cls._column_values = staticmethod(
+            getter if len(names) > 1 else lambda obj: (getter(obj),)  # pyright: ignore[reportAny]
+        )
+
     @declared_attr.directive
     def __tablename__(cls) -> str:
         """
@@ -24,8 +54,8 @@ class Base(DeclarativeBase):
         - Category -> categories
         - APIKey -> api_keys
         """
-        name = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", cls.__name__)
-        name = re.sub("([a-z0-9])([A-Z])", r"\1_\2", name).lower()
+        name = _CAMEL_WORD.sub(r"\1_\2", cls.__name__)
+        name = _CAMEL_BOUNDARY.sub(r"\1_\2", name).lower()
 
         if name.endswith("y") and len(name) > 1 and name[-2] not in "aeiou":
             return f"{name[:-1]}ies"
@@ -35,16 +65,21 @@ class Base(DeclarativeBase):
 
     def to_dict(self) -> dict[str, object]:
         """Convert model to dictionary."""
-        return {
-            str(c.name): getattr(self, str(c.name))  # pyright: ignore[reportAny]
-            for c in self.__table__.columns
-        }
+        return dict(zip(self._column_names, self._column_values(self), strict=True))
 
     @override
     def __repr__(self) -> str:
-        """String representation of model."""
+        """
+        String representation of model.
+
+        Lists every column in debug mode; otherwise only the (already
+        loaded) id, so incidental repr() calls stay cheap.
+        """
+        if not get_settings().debug:
+            return f"{self.__class__.__name__}(id={self.__dict__.get('id')!r})"
+
         columns = ", ".join(
-            f"{col.name}={getattr(self, str(col.name))!r}"  # pyright: ignore[reportAny]
-            for col in self.__table__.columns
+            f"{name}={value!r}"
+            for name, value in zip(self._column_names, self._column_values(self), strict=True)
         )
         return f"{self.__class__.__name__}({columns})"
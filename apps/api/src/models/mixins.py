@@ -15,9 +15,15 @@ class UUIDMixin:
         id: UUID v7 primary key (auto-generated)
     """
 
+    # Generated client-side so multi-row INSERTs can be batched: the known ids
+    # act as the insertmanyvalues sentinel that lines RETURNING rows up with
+    # their objects. uuidv7() on the server only covers rows inserted outside
+    # the ORM.
     id: Mapped[UUID] = mapped_column(
         primary_key=True,
         default=uuid7,
+        server_default=func.uuidv7(),
+        insert_sentinel=True,
         sort_order=-100,  # Ensure id is first column
     )
 
@@ -31,9 +37,11 @@ class TimestampMixin:
         updated_at: Timestamp when record was last updated (auto-updated)
     """
 
+    # Both are stamped by the database (now() in the INSERT/UPDATE itself)
+    # rather than a Python datetime per object; eager_defaults on Base reads
+    # the values back with RETURNING.
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(UTC),
         server_default=func.now(),
         nullable=False,
         sort_order=100,  # Place at end
@@ -41,9 +49,8 @@ class TimestampMixin:
 
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(UTC),
         server_default=func.now(),
-        onupdate=lambda: datetime.now(UTC),
+        onupdate=func.now(),
         server_onupdate=func.now(),
         nullable=False,
         sort_order=101,  # Place at end
@@ -25,8 +25,9 @@ class Session(Base, UUIDMixin, TimestampMixin):
         index=True,
     )
 
+    # Opaque ASCII tokens: byte-wise "C" collation keeps index comparisons cheap
     token: Mapped[str] = mapped_column(
-        String(255),
+        String(64, collation="C"),
         unique=True,
         index=True,
         nullable=False,
@@ -53,8 +54,11 @@ class Session(Base, UUIDMixin, TimestampMixin):
         nullable=True,
     )
 
-    # Relationship to user
-    user: Mapped[User] = relationship("User", back_populates="sessions")
+    # Relationship to user, joined into session queries since validating a
+    # session almost always needs its user (user_id is NOT NULL: inner join)
+    user: Mapped[User] = relationship(
+        "User", back_populates="sessions", lazy="joined", innerjoin=True
+    )
 
     @override
     def __repr__(self) -> str:
@@ -64,7 +68,7 @@ class Session(Base, UUIDMixin, TimestampMixin):
     @property
     def is_expired(self) -> bool:
         """Check if session is expired."""
-        return datetime.now(UTC) > self.expires_at
+        return self.is_expired_at(datetime.now(UTC))
 
     @property
     def is_revoked(self) -> bool:
@@ -74,7 +78,33 @@ class Session(Base, UUIDMixin, TimestampMixin):
     @property
     def is_valid(self) -> bool:
         """Check if session is valid (not expired and not revoked)."""
-        return not self.is_expired and not self.is_revoked
+        return self.is_valid_at(datetime.now(UTC))
+
+    def is_expired_at(self, now: datetime) -> bool:
+        """
+        Check if session is expired at a given time.
+
+        Lets callers checking several sessions share one timestamp.
+
+        Args:
+            now: Time to check against (timezone-aware)
+
+        Returns:
+            True if session has expired by ``now``
+        """
+        return now > self.expires_at
+
+    def is_valid_at(self, now: datetime) -> bool:
+        """
+        Check if session is valid (not expired and not revoked) at a given time.
+
+        Args:
+            now: Time to check against (timezone-aware)
+
+        Returns:
+            True if session is valid at ``now``
+        """
+        return self.revoked_at is None and now <= self.expires_at
 
     def revoke(self) -> None:
         """Revoke this session."""
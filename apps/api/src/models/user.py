@@ -58,10 +58,14 @@ class User(Base, FullModelMixin):
     )
 
     # Relationships
+    # Never loaded implicitly (a user can have many sessions); load with
+    # selectinload() when needed. Deletes rely on the ON DELETE CASCADE FK.
     sessions: Mapped[list[Session]] = relationship(
         "Session",
         back_populates="user",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
     @override
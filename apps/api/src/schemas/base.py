@@ -1,13 +1,17 @@
 """Base Pydantic schemas."""
 
 from datetime import datetime
-from typing import ClassVar, TypeVar
+from functools import cached_property
+from typing import Annotated, ClassVar, TypeVar
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, computed_field
 
 T = TypeVar("T", bound=BaseModel)
 
+# String with surrounding whitespace removed; used for user-entered input fields
+StrippedStr = Annotated[str, StringConstraints(strip_whitespace=True)]
+
 
 class BaseSchema(BaseModel):
     """
@@ -20,7 +24,6 @@ class BaseSchema(BaseModel):
     model_config: ClassVar[ConfigDict] = ConfigDict(
         from_attributes=True,
         populate_by_name=True,
-        str_strip_whitespace=True,
         use_enum_values=True,
     )
 
@@ -128,17 +131,20 @@ class PaginatedResponse[T](BaseSchema):
     page: int = Field(..., ge=1, description="Current page number")
     page_size: int = Field(..., ge=1, description="Items per page")
 
-    @property
+    @computed_field
+    @cached_property
     def total_pages(self) -> int:
         """Calculate total number of pages."""
         return (self.total + self.page_size - 1) // self.page_size
 
-    @property
+    @computed_field
+    @cached_property
     def has_next(self) -> bool:
         """Check if there's a next page."""
         return self.page < self.total_pages
 
-    @property
+    @computed_field
+    @cached_property
     def has_previous(self) -> bool:
         """Check if there's a previous page."""
         return self.page > 1
@@ -2,9 +2,9 @@
 
 from datetime import datetime
 
-from pydantic import EmailStr, Field, field_validator
+from pydantic import EmailStr, Field, computed_field, field_validator
 
-from src.schemas.base import BaseModelSchema, BaseSchema
+from src.schemas.base import BaseModelSchema, BaseSchema, StrippedStr
 from src.schemas.validators import PasswordValidator, UsernameValidator
 
 
@@ -16,9 +16,9 @@ class UserBase(BaseSchema):
     """
 
     email: EmailStr = Field(..., description="User email address", max_length=255)
-    username: str | None = Field(None, description="Username", min_length=3, max_length=50)
-    first_name: str | None = Field(None, description="First name", max_length=100)
-    last_name: str | None = Field(None, description="Last name", max_length=100)
+    username: StrippedStr | None = Field(None, description="Username", min_length=3, max_length=50)
+    first_name: StrippedStr | None = Field(None, description="First name", max_length=100)
+    last_name: StrippedStr | None = Field(None, description="Last name", max_length=100)
 
     @field_validator("username")
     @classmethod
@@ -35,7 +35,7 @@ class UserCreate(UserBase):
     Password will be hashed before storing in database.
     """
 
-    password: str = Field(..., description="User password", min_length=8, max_length=100)
+    password: StrippedStr = Field(..., description="User password", min_length=8, max_length=100)
     is_active: bool = Field(default=True, description="Whether user is active")
     is_superuser: bool = Field(default=False, description="Whether user is superuser")
 
@@ -54,10 +54,12 @@ class UserUpdate(BaseSchema):
     """
 
     email: EmailStr | None = Field(None, description="User email address", max_length=255)
-    username: str | None = Field(None, description="Username", min_length=3, max_length=50)
-    first_name: str | None = Field(None, description="First name", max_length=100)
-    last_name: str | None = Field(None, description="Last name", max_length=100)
-    password: str | None = Field(None, description="New password", min_length=8, max_length=100)
+    username: StrippedStr | None = Field(None, description="Username", min_length=3, max_length=50)
+    first_name: StrippedStr | None = Field(None, description="First name", max_length=100)
+    last_name: StrippedStr | None = Field(None, description="Last name", max_length=100)
+    password: StrippedStr | None = Field(
+        None, description="New password", min_length=8, max_length=100
+    )
     is_active: bool | None = Field(None, description="Whether user is active")
     is_superuser: bool | None = Field(None, description="Whether user is superuser")
 
@@ -89,6 +91,7 @@ class UserResponse(BaseModelSchema):
     is_active: bool = Field(..., description="Whether user is active")
     is_superuser: bool = Field(..., description="Whether user is superuser")
 
+    @computed_field
     @property
     def full_name(self) -> str | None:
         """Get user's full name."""
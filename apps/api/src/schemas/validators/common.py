@@ -1,8 +1,73 @@
 """Common reusable validators."""
 
 import re
+import string
+from functools import cache, lru_cache
 from typing import ClassVar
 
+# Character classes for password checks; set lookups avoid a Python-level
+# loop over the password per rule.
+_UPPER = frozenset(string.ascii_uppercase)
+_LOWER = frozenset(string.ascii_lowercase)
+_DIGITS = frozenset(string.digits)
+_SPECIALS = frozenset('!@#$%^&*(),.?":{}|<>+-=\\/[]')
+
+# Bit flags for the character classes found in a password
+_HAS_UPPER = 1
+_HAS_LOWER = 2
+_HAS_DIGIT = 4
+_HAS_SPECIAL = 8
+_HAS_ALNUM = _HAS_UPPER | _HAS_LOWER | _HAS_DIGIT
+
+
+def _password_char_classes(value: str) -> int:
+    """Return the character-class flags present in a password."""
+    chars = set(value)
+    flags = 0
+    if not _UPPER.isdisjoint(chars):
+        flags |= _HAS_UPPER
+    if not _LOWER.isdisjoint(chars):
+        flags |= _HAS_LOWER
+    if not _DIGITS.isdisjoint(chars):
+        flags |= _HAS_DIGIT
+    if not _SPECIALS.isdisjoint(chars):
+        flags |= _HAS_SPECIAL
+
+    if flags & _HAS_ALNUM != _HAS_ALNUM and not value.isascii():
+        # Non-ASCII letters and digits still count. A cased letter shows up as
+        # a change under lower()/upper(), each a single pass in C.
+        if value.lower() != value:
+            flags |= _HAS_UPPER
+        if value.upper() != value:
+            flags |= _HAS_LOWER
+        if not flags & _HAS_DIGIT and any(c.isdigit() for c in chars):
+            flags |= _HAS_DIGIT
+    return flags
+
+
+@lru_cache(maxsize=32)
+def _compile_username_pattern(
+    allow_uppercase: bool, allow_underscore: bool, allow_hyphen: bool, custom_pattern: str | None
+) -> re.Pattern[str]:
+    """Build and compile the username pattern for a set of options."""
+    if custom_pattern:
+        return re.compile(custom_pattern)
+
+    chars = "a-z0-9"
+    if allow_uppercase:
+        chars += "A-Z"
+    if allow_underscore:
+        chars += "_"
+    if allow_hyphen:
+        chars += "-"
+    return re.compile(f"^[{chars}]+$")
+
+
+@cache
+def _default_validator[T](cls: type[T]) -> T:
+    """Return the shared default-configured instance of a validator class."""
+    return cls()
+
 
 class PasswordValidator:
     """
@@ -48,6 +113,8 @@ class PasswordValidator:
         """
         Initialize password validator with custom rules.
 
+        Rules are fixed once the validator is created.
+
         Args:
             min_length: Minimum password length
             max_length: Maximum password length
@@ -71,6 +138,15 @@ class PasswordValidator:
             require_special if require_special is not None else self.DEFAULT_REQUIRE_SPECIAL
         )
 
+        # Character classes the password must contain, resolved once here
+        # rather than on every validate() call
+        self._required_classes: int = (
+            (_HAS_UPPER if self.require_uppercase else 0)
+            | (_HAS_LOWER if self.require_lowercase else 0)
+            | (_HAS_DIGIT if self.require_digit else 0)
+            | (_HAS_SPECIAL if self.require_special else 0)
+        )
+
     def validate(self, value: str | None) -> str | None:
         """
         Validate password against configured rules.
@@ -93,16 +169,18 @@ class PasswordValidator:
         if len(value) > self.max_length:
             raise ValueError(f"Password must be at most {self.max_length} characters long")
 
-        if self.require_uppercase and not any(c.isupper() for c in value):
-            raise ValueError("Password must contain at least one uppercase letter")
+        required = self._required_classes
+        if not required:
+            return value
 
-        if self.require_lowercase and not any(c.islower() for c in value):
+        missing = required & ~_password_char_classes(value)
+        if missing & _HAS_UPPER:
+            raise ValueError("Password must contain at least one uppercase letter")
+        if missing & _HAS_LOWER:
             raise ValueError("Password must contain at least one lowercase letter")
-
-        if self.require_digit and not any(c.isdigit() for c in value):
+        if missing & _HAS_DIGIT:
             raise ValueError("Password must contain at least one digit")
-
-        if self.require_special and not re.search(r"[!@#$%^&*(),.?\":{}|<>+\-=\\/\[\]]", value):
+        if missing & _HAS_SPECIAL:
             raise ValueError("Password must contain at least one special character")
 
         return value
@@ -118,7 +196,7 @@ class PasswordValidator:
         Returns:
             Validated password
         """
-        return cls().validate(value)
+        return _default_validator(cls).validate(value)
 
     @classmethod
     def validate_required(cls, value: str) -> str:
@@ -131,7 +209,7 @@ class PasswordValidator:
         Returns:
             Validated password
         """
-        result = cls().validate(value)
+        result = _default_validator(cls).validate(value)
         assert result is not None
         return result
 
@@ -200,17 +278,25 @@ class UsernameValidator:
             allow_hyphen if allow_hyphen is not None else self.DEFAULT_ALLOW_HYPHEN
         )
 
-        if custom_pattern:
-            self.pattern: str = custom_pattern
-        else:
-            chars = "a-z0-9"
-            if self.allow_uppercase:
-                chars += "A-Z"
-            if self.allow_underscore:
-                chars += "_"
-            if self.allow_hyphen:
-                chars += "-"
-            self.pattern = f"^[{chars}]+$"
+        self._regex: re.Pattern[str] = _compile_username_pattern(
+            self.allow_uppercase, self.allow_underscore, self.allow_hyphen, custom_pattern
+        )
+        self.pattern: str = self._regex.pattern
+
+        # Built-in patterns are a single character class, checked with a set
+        # lookup; only custom patterns go through the regex engine.
+        self._allowed_chars: frozenset[str] | None = None
+        if not custom_pattern:
+            self._allowed_chars = frozenset(
+                string.ascii_lowercase
+                + string.digits
+                + (string.ascii_uppercase if self.allow_uppercase else "")
+                + ("_" if self.allow_underscore else "")
+                + ("-" if self.allow_hyphen else "")
+            )
+        self._edge_chars: str = ("_" if self.allow_underscore else "") + (
+            "-" if self.allow_hyphen else ""
+        )
 
     def validate(self, value: str | None) -> str | None:
         """
@@ -228,6 +314,7 @@ class UsernameValidator:
         if value is None:
             return None
 
+        # strip() returns the same object when there is nothing to strip
         value = value.strip()
 
         if len(value) < self.min_length:
@@ -236,7 +323,12 @@ class UsernameValidator:
         if len(value) > self.max_length:
             raise ValueError(f"Username must be at most {self.max_length} characters long")
 
-        if not re.match(self.pattern, value):
+        if self._allowed_chars is not None:
+            matches = self._allowed_chars.issuperset(value)
+        else:
+            matches = self._regex.match(value) is not None
+
+        if not matches:
             allowed_chars = "letters and numbers"
             if self.allow_underscore:
                 allowed_chars += ", underscores"
@@ -244,15 +336,8 @@ class UsernameValidator:
                 allowed_chars += ", and hyphens"
             raise ValueError(f"Username must contain only {allowed_chars}")
 
-        if self.allow_underscore or self.allow_hyphen:
-            special_chars: list[str] = []
-            if self.allow_underscore:
-                special_chars.append("_")
-            if self.allow_hyphen:
-                special_chars.append("-")
-
-            if value[0] in special_chars or value[-1] in special_chars:
-                raise ValueError("Username cannot start or end with special characters")
+        if self._edge_chars and (value[0] in self._edge_chars or value[-1] in self._edge_chars):
+            raise ValueError("Username cannot start or end with special characters")
 
         return value
 
@@ -267,7 +352,7 @@ class UsernameValidator:
         Returns:
             Validated username
         """
-        return cls().validate(value)
+        return _default_validator(cls).validate(value)
 
     @classmethod
     def validate_required(cls, value: str) -> str:
@@ -280,6 +365,6 @@ class UsernameValidator:
         Returns:
             Validated username
         """
-        result = cls().validate(value)
+        result = _default_validator(cls).validate(value)
         assert result is not None
         return result
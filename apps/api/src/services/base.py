@@ -1,5 +1,6 @@
 """Base service layer for business logic."""
 
+from collections.abc import Sequence
 from typing import TypeVar
 from uuid import UUID
 
@@ -20,7 +21,7 @@ class BaseService[ModelType: Base]:
         ```python
         class UserService(BaseService[User]):
             def __init__(self, session: AsyncSession):
-                repository = UserRepository(session)
+                repository = UserRepository.for_session(session)
                 super().__init__(repository, session)
         ```
     """
@@ -45,7 +46,12 @@ class BaseService[ModelType: Base]:
         return await self.repository.get(id)
 
     async def get_by_id_or_fail(self, id: UUID) -> ModelType:
-        """Get entity by ID or raise exception."""
+        """
+        Get entity by ID or raise exception.
+
+        Uses ``session.get``, so an instance already in the identity map is
+        returned without a query and stays attached for a following update().
+        """
         entity = await self.repository.get(id)
         if not entity:
             raise RecordNotFoundException(
@@ -59,26 +65,34 @@ class BaseService[ModelType: Base]:
         skip: int = 0,
         limit: int = 100,
         order_by: str | None = None,
-    ) -> list[ModelType]:
+    ) -> Sequence[ModelType]:
         """Get multiple entities with pagination."""
         return await self.repository.get_multi(skip=skip, limit=limit, order_by=order_by)
 
-    async def create(self, entity: ModelType) -> ModelType:
-        """Create new entity."""
+    async def create(self, entity: ModelType, *, commit: bool = True) -> ModelType:
+        """
+        Create new entity.
+
+        Pass ``commit=False`` to leave the change flushed but uncommitted, so
+        several writes can share one transaction (see ``UnitOfWork``).
+        """
         created = await self.repository.create(entity)
-        await self.session.commit()
+        if commit:
+            await self.session.commit()
         return created
 
-    async def update(self, entity: ModelType) -> ModelType:
-        """Update existing entity."""
+    async def update(self, entity: ModelType, *, commit: bool = True) -> ModelType:
+        """Update existing entity, committing unless ``commit=False``."""
         updated = await self.repository.update(entity)
-        await self.session.commit()
+        if commit:
+            await self.session.commit()
         return updated
 
-    async def delete(self, id: UUID) -> bool:
-        """Delete entity by ID."""
+    async def delete(self, id: UUID, *, commit: bool = True) -> bool:
+        """Delete entity by ID, committing unless ``commit=False``."""
         deleted = await self.repository.delete(id)
-        await self.session.commit()
+        if commit:
+            await self.session.commit()
         return deleted
 
     async def exists(self, id: UUID) -> bool:
@@ -100,6 +114,6 @@ class BaseService[ModelType: Base]:
         *,
         skip: int = 0,
         limit: int = 100,
-    ) -> list[ModelType]:
+    ) -> Sequence[ModelType]:
         """Get multiple entities by field value."""
         return await self.repository.get_multi_by_field(field, value, skip=skip, limit=limit)
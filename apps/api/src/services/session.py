@@ -1,15 +1,32 @@
 """Session service for user authentication."""
 
-import secrets
+import base64
+import os
+from collections.abc import Callable, Sequence
 from uuid import UUID
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
 
+from src.core.cache import TTLCache
+from src.core.settings import settings
 from src.db.repositories.session import SessionRepository
 from src.models.session import Session
 from src.models.user import User
 from src.services.base import BaseService
 
+_B64 = base64.urlsafe_b64encode
+
+# Column values of active sessions by token, shared by all requests in this
+# process. Plain tuples, never ORM instances, so no entry is tied to the
+# AsyncSession that loaded it. Revocations made here invalidate entries; ones
+# made by other processes are seen only after the TTL.
+_session_cache: TTLCache[str, tuple[object, ...]] = TTLCache(
+    maxsize=10_000, ttl=settings.session_cache_ttl
+)
+
 
 class SessionService(BaseService[Session]):
     """
@@ -20,7 +37,7 @@ class SessionService(BaseService[Session]):
 
     def __init__(self, session: AsyncSession) -> None:
         """Initialize session service."""
-        self.repository = SessionRepository(session)
+        self.repository = SessionRepository.for_session(session)
         super().__init__(self.repository, session)
 
     async def create_session(
@@ -30,6 +47,7 @@ class SessionService(BaseService[Session]):
         expires_hours: int = 24,
         ip_address: str | None = None,
         user_agent: str | None = None,
+        commit: bool = True,
     ) -> Session:
         """
         Create a new session for a user.
@@ -39,11 +57,13 @@ class SessionService(BaseService[Session]):
             expires_hours: Session expiration in hours (default: 24)
             ip_address: Optional IP address of client
             user_agent: Optional user agent string
+            commit: Commit immediately; pass False inside a ``UnitOfWork``
 
         Returns:
             Created session
         """
-        token = secrets.token_urlsafe(32)
+        # Same 43-character url-safe token as secrets.token_urlsafe(32)
+        token = _B64(os.urandom(32)).rstrip(b"=").decode("ascii")
 
         session_obj = Session(
             user_id=user.id,
@@ -53,7 +73,7 @@ class SessionService(BaseService[Session]):
             user_agent=user_agent,
         )
 
-        return await self.create(session_obj)
+        return await self.create(session_obj, commit=commit)
 
     async def get_by_token(self, token: str) -> Session | None:
         """
@@ -71,13 +91,68 @@ class SessionService(BaseService[Session]):
         """
         Get active session by token.
 
+        Results are cached per process for ``SESSION_CACHE_TTL`` seconds, so
+        a session revoked by another process can remain usable until then.
+
         Args:
             token: Session token
 
         Returns:
             Session or None if not found or invalid
         """
-        return await self.repository.get_active_session_by_token(token)
+        if not settings.session_cache_enabled:
+            return await self.repository.get_active_session_by_token(token)
+
+        cached = _session_cache.get(token)
+        if cached is not None:
+            session_obj = await self._from_snapshot(cached)
+            if session_obj.is_valid:
+                return session_obj
+            _ = _session_cache.pop(token)
+
+        session_obj = await self.repository.get_active_session_by_token(token)
+        if session_obj is not None:
+            _session_cache.set(token, Session._column_values(session_obj))
+        return session_obj
+
+    async def _from_snapshot(self, values: tuple[object, ...]) -> Session:
+        """
+        Rebuild a cached session in this request's database session.
+
+        The session row comes from the cache without a query; its user is
+        loaded through the current session, so account changes apply at once.
+
+        Args:
+            values: Session column values, in ``Session._column_names`` order
+
+        Returns:
+            Persistent Session bound to ``self.session``
+        """
+        snapshot = Session(**dict(zip(Session._column_names, values, strict=True)))
+        make_transient_to_detached(snapshot)
+        session_obj = await self.session.merge(snapshot, load=False)
+
+        if "user" not in session_obj.__dict__:
+            user = await self.session.get(User, session_obj.user_id)
+            set_committed_value(session_obj, "user", user)
+        return session_obj
+
+    def _evict_after_commit(self, evict: Callable[[], object], *, committed: bool) -> None:
+        """
+        Evict session cache entries once a revocation is committed.
+
+        Evicting any earlier would let a concurrent lookup re-cache the old
+        row. When the caller commits later (``commit=False``), eviction runs
+        on that commit.
+
+        Args:
+            evict: Callable removing the affected entries
+            committed: Whether the revocation has already been committed
+        """
+        if committed:
+            _ = evict()
+        else:
+            event.listen(self.session.sync_session, "after_commit", lambda _: evict(), once=True)
 
     async def validate_session(self, token: str) -> Session | None:
         """
@@ -95,33 +170,39 @@ class SessionService(BaseService[Session]):
 
         return session_obj if session_obj.is_valid else None
 
-    async def revoke_session(self, token: str) -> bool:
+    async def revoke_session(self, token: str, *, commit: bool = True) -> bool:
         """
         Revoke a session.
 
         Args:
             token: Session token
+            commit: Commit immediately; pass False inside a ``UnitOfWork``
 
         Returns:
-            True if revoked, False if not found
+            True if revoked, False if not found or already revoked
         """
         revoked = await self.repository.revoke_session(token)
-        if revoked:
+        if revoked and commit:
             await self.session.commit()
+        self._evict_after_commit(lambda: _session_cache.pop(token), committed=commit)
         return revoked
 
-    async def revoke_user_sessions(self, user_id: UUID) -> int:
+    async def revoke_user_sessions(self, user_id: UUID, *, commit: bool = True) -> int:
         """
         Revoke all active sessions for a user.
 
         Args:
             user_id: User UUID
+            commit: Commit immediately; pass False inside a ``UnitOfWork``
 
         Returns:
             Number of sessions revoked
         """
         count = await self.repository.revoke_user_sessions(user_id)
-        await self.session.commit()
+        if commit:
+            await self.session.commit()
+        # Tokens aren't indexed by user; revoking all of a user's sessions is rare
+        self._evict_after_commit(_session_cache.clear, committed=commit)
         return count
 
     async def get_user_sessions(
@@ -130,7 +211,7 @@ class SessionService(BaseService[Session]):
         *,
         include_expired: bool = False,
         include_revoked: bool = False,
-    ) -> list[Session]:
+    ) -> Sequence[Session]:
         """
         Get all sessions for a user.
 
@@ -148,13 +229,17 @@ class SessionService(BaseService[Session]):
             include_revoked=include_revoked,
         )
 
-    async def cleanup_expired_sessions(self) -> int:
+    async def cleanup_expired_sessions(self, *, commit: bool = True) -> int:
         """
         Delete expired and revoked sessions.
 
+        Args:
+            commit: Commit immediately; pass False inside a ``UnitOfWork``
+
         Returns:
             Number of sessions deleted
         """
         count = await self.repository.cleanup_expired_sessions()
-        await self.session.commit()
+        if commit:
+            await self.session.commit()
         return count
@@ -1,14 +1,35 @@
 """User service for business logic."""
 
+import secrets
+from collections.abc import Sequence
+from uuid import UUID
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.exceptions.database import DuplicateRecordException
-from src.core.security import hash_password, verify_password
+from src.core.security import (
+    hash_password_async,
+    password_needs_update,
+    verify_password_async,
+)
 from src.db.repositories.user import UserRepository
 from src.models.user import User
 from src.schemas.user import UserCreate, UserUpdate
 from src.services.base import BaseService
 
+# Hash of a random password, verified against when no user has the given
+# email so that unknown emails cost the same hash as known ones. Built on
+# first use rather than at import.
+_dummy_hash: str | None = None
+
+
+async def _get_dummy_hash() -> str:
+    """Get the dummy password hash, creating it on first use."""
+    global _dummy_hash
+    if _dummy_hash is None:
+        _dummy_hash = await hash_password_async(secrets.token_urlsafe(16))
+    return _dummy_hash
+
 
 class UserService(BaseService[User]):
     """User service with user-specific business logic."""
@@ -17,48 +38,55 @@ class UserService(BaseService[User]):
 
     def __init__(self, session: AsyncSession) -> None:
         """Initialize user service."""
-        repository = UserRepository(session)
+        repository = UserRepository.for_session(session)
         super().__init__(repository, session)
         self.repository = repository
 
-    async def create_user(self, data: UserCreate) -> User:
+    async def create_user(self, data: UserCreate, *, commit: bool = True) -> User:
         """Create a new user with password hashing and validation."""
-        if await self.repository.email_exists(data.email):
+        email_taken, username_taken = await self.repository.find_conflicts(
+            email=data.email, username=data.username
+        )
+        if email_taken:
             raise DuplicateRecordException(f"Email {data.email} already exists")
-
-        if data.username and await self.repository.username_exists(data.username):
+        if username_taken:
             raise DuplicateRecordException(f"Username {data.username} already exists")
 
         user = User(
             email=data.email,
             username=data.username,
-            hashed_password=hash_password(data.password),
+            hashed_password=await hash_password_async(data.password),
             first_name=data.first_name,
             last_name=data.last_name,
             is_active=data.is_active,
             is_superuser=data.is_superuser,
         )
 
-        return await self.create(user)
+        return await self.create(user, commit=commit)
 
     async def update_user(self, user_id: str, data: UserUpdate) -> User:
         """Update an existing user."""
-        from uuid import UUID
-
         user = await self.get_by_id_or_fail(UUID(user_id))
 
-        if data.email and data.email != user.email:
-            if await self.repository.email_exists(data.email):
-                raise DuplicateRecordException(f"Email {data.email} already exists")
-            user.email = data.email
+        new_email = data.email if data.email and data.email != user.email else None
+        new_username = data.username if data.username and data.username != user.username else None
+
+        if new_email or new_username:
+            email_taken, username_taken = await self.repository.find_conflicts(
+                email=new_email, username=new_username, exclude_id=user.id
+            )
+            if email_taken:
+                raise DuplicateRecordException(f"Email {new_email} already exists")
+            if username_taken:
+                raise DuplicateRecordException(f"Username {new_username} already exists")
 
-        if data.username and data.username != user.username:
-            if await self.repository.username_exists(data.username):
-                raise DuplicateRecordException(f"Username {data.username} already exists")
-            user.username = data.username
+            if new_email:
+                user.email = new_email
+            if new_username:
+                user.username = new_username
 
         if data.password:
-            user.hashed_password = hash_password(data.password)
+            user.hashed_password = await hash_password_async(data.password)
 
         if data.first_name is not None:
             user.first_name = data.first_name
@@ -79,44 +107,52 @@ class UserService(BaseService[User]):
         """Get user by username."""
         return await self.repository.get_by_username(username)
 
-    async def get_active_users(self, *, skip: int = 0, limit: int = 100) -> list[User]:
+    async def get_active_users(self, *, skip: int = 0, limit: int = 100) -> Sequence[User]:
         """Get all active users."""
         return await self.repository.get_active_users(skip=skip, limit=limit)
 
     async def authenticate(self, email: str, password: str) -> User | None:
-        """Authenticate user by email and password."""
+        """
+        Authenticate user by email and password.
+
+        An outdated password hash is upgraded and flushed, but not committed:
+        it is saved when the caller (or its ``UnitOfWork``) commits.
+        """
         user = await self.get_by_email(email)
         if not user:
+            # Nothing can match the random dummy password; this only evens out timing
+            _ = await verify_password_async(password, await _get_dummy_hash())
             return None
 
-        if not verify_password(password, user.hashed_password):
+        # Inactive accounts are rejected before the (expensive) hash check.
+        # This lets response timing reveal that an inactive account exists.
+        if not user.is_active:
             return None
 
-        if not user.is_active:
+        if not await verify_password_async(password, user.hashed_password):
             return None
 
+        # Upgrade hashes made with older parameters while the password is at hand
+        if password_needs_update(user.hashed_password):
+            user.hashed_password = await hash_password_async(password)
+            user = await self.update(user, commit=False)
+
         return user
 
     async def deactivate_user(self, user_id: str) -> User:
         """Deactivate user account."""
-        from uuid import UUID
-
         user = await self.get_by_id_or_fail(UUID(user_id))
         user.is_active = False
         return await self.update(user)
 
     async def activate_user(self, user_id: str) -> User:
         """Activate user account."""
-        from uuid import UUID
-
         user = await self.get_by_id_or_fail(UUID(user_id))
         user.is_active = True
         return await self.update(user)
 
     async def soft_delete_user(self, user_id: str) -> User:
         """Soft delete user."""
-        from uuid import UUID
-
         user = await self.get_by_id_or_fail(UUID(user_id))
         user.soft_delete()
         return await self.update(user)